@@ -223,6 +223,10 @@ def cmd_optimize(args) -> None:
         'mutation_percent_genes': 20,
         'keep_parents': 1
     }
+    # More workers than solutions would leave the extra workers idle
+    workers = min(args.workers, args.population)
+    if workers > 1:
+        ga_params['parallel_processing'] = ['process', workers]
 
     # Extract constraints from scenario
     constraints = scenario_config.get('constraints', {})
@@ -588,6 +592,7 @@ For more information, see README.md
     opt_parser.add_argument('--expert-judgments', default='data/expert_judgments/primary_capabilities.yaml', help='Path to expert judgments (default: data/expert_judgments/primary_capabilities.yaml)')
     opt_parser.add_argument('--population', type=int, default=20, help='Population size (default: 20)')
     opt_parser.add_argument('--generations', type=int, default=50, help='Number of generations (default: 50)')
+    opt_parser.add_argument('--workers', type=int, default=1, help='Worker processes for fitness evaluation; more than 1 disables the cross-generation fitness cache (default: 1, serial)')
     opt_parser.add_argument('--output', help='Output file path (JSON format)')
 
     # Sensitivity command
@@ -5,6 +5,10 @@ Implements Saaty's AHP method for calculating indicator weights from expert
 pairwise comparison matrices with consistency validation.
 """
 
+import copy
+import os
+from functools import lru_cache
+
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import yaml
@@ -36,7 +40,7 @@ def calculate_weights(judgment_matrix: np.ndarray,
 
     Returns:
         Dictionary containing:
-            'weights': np.ndarray of normalized weights (sum = 1.0)
+            'weights': np.ndarray of normalized weights, shape (n,) (sum = 1.0)
             'lambda_max': float, maximum eigenvalue
             'CR': float, Consistency Ratio
             'CI': float, Consistency Index
@@ -188,6 +192,10 @@ def load_judgment_matrix(file_path: str) -> Dict[str, Any]:
     """
     Load judgment matrix from YAML file.
 
+    Parsed files are cached on (path, mtime, size), so repeated evaluations
+    against the same expert judgments read each file once; every call still
+    returns its own copy of the data.
+
     Args:
         file_path: Path to YAML file containing judgment matrix
 
@@ -198,28 +206,12 @@ def load_judgment_matrix(file_path: str) -> Dict[str, Any]:
         JudgmentMatrixError: If file cannot be loaded or is invalid
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-
-        # Validate required fields
-        required_fields = ['matrix_id', 'matrix']
-        for field in required_fields:
-            if field not in data:
-                raise JudgmentMatrixError(f"Missing required field: {field}")
-
-        # Convert matrix to numpy array
-        matrix = np.array(data['matrix'], dtype=float)
-
-        # Validate matrix dimensions
-        expected_dim = data.get('dimension', matrix.shape[0])  # Use matrix size if dimension not provided
-        if matrix.shape != (expected_dim, expected_dim):
-            # Only raise error if dimension is explicitly provided and doesn't match
-            if 'dimension' in data:
-                raise JudgmentMatrixError(f"Matrix dimension mismatch: expected {expected_dim}x{expected_dim}, got {matrix.shape}")
-            else:
-                raise JudgmentMatrixError(f"Matrix must be square: got {matrix.shape}")
-
-        return data
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Nothing to key a cache entry on; let the parse report the problem
+            return _parse_judgment_file(file_path)
+        return copy.deepcopy(_cached_judgment_file(file_path, stat.st_mtime_ns, stat.st_size))
 
     except yaml.YAMLError as e:
         raise JudgmentMatrixError(f"Error parsing YAML file {file_path}: {e}")
@@ -229,6 +221,38 @@ def load_judgment_matrix(file_path: str) -> Dict[str, Any]:
         raise JudgmentMatrixError(f"Error loading judgment matrix: {e}")
 
 
+@lru_cache(maxsize=64)
+def _cached_judgment_file(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Cached ``_parse_judgment_file``; mtime_ns and size only key the cache."""
+    return _parse_judgment_file(file_path)
+
+
+def _parse_judgment_file(file_path: str) -> Dict[str, Any]:
+    """Parse and validate one judgment matrix file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+
+    # Validate required fields
+    required_fields = ['matrix_id', 'matrix']
+    for field in required_fields:
+        if field not in data:
+            raise JudgmentMatrixError(f"Missing required field: {field}")
+
+    # Convert matrix to numpy array
+    matrix = np.array(data['matrix'], dtype=float)
+
+    # Validate matrix dimensions
+    expected_dim = data.get('dimension', matrix.shape[0])  # Use matrix size if dimension not provided
+    if matrix.shape != (expected_dim, expected_dim):
+        # Only raise error if dimension is explicitly provided and doesn't match
+        if 'dimension' in data:
+            raise JudgmentMatrixError(f"Matrix dimension mismatch: expected {expected_dim}x{expected_dim}, got {matrix.shape}")
+        else:
+            raise JudgmentMatrixError(f"Matrix must be square: got {matrix.shape}")
+
+    return data
+
+
 def calculate_primary_weights(primary_matrix_file: str,
                             secondary_matrices_dir: str,
                             cr_threshold: float = 0.1) -> Dict[str, Any]:
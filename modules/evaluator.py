@@ -19,6 +19,13 @@ from modules.topsis_module import topsis_rank
 from utils.validation import AuditLogger, validate_evaluation_result, validate_scheme_config
 from utils.consistency_check import calculate_cr
 
+# Secondary indicators in decision-matrix column order
+_INDICATOR_ORDER = (
+    'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
+    'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
+    'C5_1', 'C5_2', 'C5_3'
+)
+
 
 class EvaluatorError(Exception):
     """Base exception for evaluator module."""
@@ -171,8 +178,10 @@ def evaluate_batch(schemes: List[Dict[str, Any]],
         global_weights = weights_result['global_weights']
 
         # Evaluate each scheme individually and collect indicator values
+        # straight into a preallocated decision matrix (one row per scheme)
         individual_results = []
-        decision_matrix = []
+        decision_matrix = np.empty((len(schemes), len(_INDICATOR_ORDER)))
+        num_rows = 0
 
         for scheme in schemes:
             try:
@@ -183,13 +192,11 @@ def evaluate_batch(schemes: List[Dict[str, Any]],
                 indicator_values = result.get('indicator_values', {})
                 if indicator_values:
                     # Ensure consistent ordering
-                    indicator_order = [
-                        'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
-                        'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
-                        'C5_1', 'C5_2', 'C5_3'
-                    ]
-                    row = [indicator_values.get(ind_id, 0.0) for ind_id in indicator_order]
-                    decision_matrix.append(row)
+                    decision_matrix[num_rows] = np.fromiter(
+                        (indicator_values.get(ind_id, 0.0) for ind_id in _INDICATOR_ORDER),
+                        dtype=np.float64, count=len(_INDICATOR_ORDER)
+                    )
+                    num_rows += 1
 
                 batch_results['individual_results'][scheme['scheme_id']] = result
             except Exception as e:
@@ -198,7 +205,7 @@ def evaluate_batch(schemes: List[Dict[str, Any]],
                 raise EvaluationError(error_msg)
 
         # Prepare decision matrix for TOPSIS
-        decision_matrix = np.array(decision_matrix)
+        decision_matrix = decision_matrix[:num_rows]
 
         # Determine indicator types
         indicator_types = _get_indicator_types(indicator_config)
@@ -583,11 +590,7 @@ def _prepare_topsis_input(indicator_values: Dict[str, Any],
     }
 
     # Ensure consistent ordering
-    indicator_order = [
-        'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
-        'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
-        'C5_1', 'C5_2', 'C5_3'
-    ]
+    indicator_order = _INDICATOR_ORDER
 
     baseline_row = [baseline_values[ind_id] for ind_id in indicator_order]
     scheme_row = [indicator_values[ind_id] for ind_id in indicator_order]
@@ -608,11 +611,7 @@ def _apply_topsis(decision_matrix: np.ndarray,
                  audit_logger: AuditLogger) -> Dict[str, Any]:
     """Apply TOPSIS ranking to decision matrix."""
     # Prepare weights array in consistent order
-    indicator_order = [
-        'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
-        'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
-        'C5_1', 'C5_2', 'C5_3'
-    ]
+    indicator_order = _INDICATOR_ORDER
 
     weights_array = np.array([global_weights[ind_id] for ind_id in indicator_order])
 
@@ -639,11 +638,7 @@ def _apply_topsis(decision_matrix: np.ndarray,
 
 def _get_indicator_types(indicator_config: Dict[str, Any]) -> List[str]:
     """Get indicator types from configuration."""
-    indicator_order = [
-        'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
-        'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
-        'C5_1', 'C5_2', 'C5_3'
-    ]
+    indicator_order = _INDICATOR_ORDER
 
     secondary_indicators = indicator_config['secondary_indicators']
     indicator_types = []
@@ -854,11 +849,7 @@ def _prepare_scenario_aware_topsis_input(indicator_values: Dict[str, float],
                 baseline_values[key] = adjusted_baseline[key]
 
     # Ensure consistent ordering
-    indicator_order = [
-        'C1_1', 'C1_2', 'C1_3', 'C2_1', 'C2_2', 'C2_3',
-        'C3_1', 'C3_2', 'C3_3', 'C4_1', 'C4_2', 'C4_3',
-        'C5_1', 'C5_2', 'C5_3'
-    ]
+    indicator_order = _INDICATOR_ORDER
 
     baseline_row = [baseline_values[ind_id] for ind_id in indicator_order]
     scheme_row = [indicator_values[ind_id] for ind_id in indicator_order]
@@ -10,8 +10,11 @@ import pygad
 import matplotlib.pyplot as plt
 from typing import Dict, List, Any, Optional, Tuple
 import json
+import math
+import os
 import yaml
 from datetime import datetime
+from functools import lru_cache
 
 from modules.evaluator import evaluate_single_scheme
 from utils.validation import AuditLogger
@@ -53,10 +56,10 @@ def decode_chromosome(chromosome: np.ndarray,
             'simulation_parameters': {}
         }
 
-        # Decode platform counts
+        # Decode platform counts (one slice of the integer-valued count genes)
         platform_types = gene_config['platform_types']
-        for i, platform_type in enumerate(platform_types):
-            count = int(chromosome[i])
+        counts = np.asarray(chromosome[:len(platform_types)]).astype(np.int64).tolist()
+        for platform_type, count in zip(platform_types, counts):
             configuration['platform_inventory'][platform_type] = {
                 'count': count,
                 'types': {}  # Simplified for prototype
@@ -126,6 +129,26 @@ def decode_chromosome(chromosome: np.ndarray,
         raise GAError(f"Failed to decode chromosome: {e}")
 
 
+# Platform-type keywords in matching order, with the cost key and default unit cost
+_COST_CATEGORIES = (
+    ('patrol', 'patrol_usv', 2.5),
+    ('surveillance', 'surveillance_usv', 3.0),
+    ('strike', 'strike_usv', 4.0),
+    ('attack', 'attack_uuv', 5.0),
+    ('reconnaissance', 'reconnaissance_uuv', 2.0),
+)
+
+
+@lru_cache(maxsize=None)
+def _cost_category(platform_type: str) -> Tuple[Optional[str], float]:
+    """Cost key and default unit cost for a platform type, (None, 2.5) if none matches."""
+    lowered = platform_type.lower()
+    for keyword, cost_key, default_cost in _COST_CATEGORIES:
+        if keyword in lowered:
+            return cost_key, default_cost
+    return None, 2.5
+
+
 def validate_constraints(configuration: Dict[str, Any],
                         constraints: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -180,18 +203,11 @@ def validate_constraints(configuration: Dict[str, Any],
             for platform_type, data in platform_inventory.items():
                 count = data.get('count', 0)
                 # Map platform type to cost category
-                if 'patrol' in platform_type.lower():
-                    cost_per = cost_per_platform.get('patrol_usv', 2.5)
-                elif 'surveillance' in platform_type.lower():
-                    cost_per = cost_per_platform.get('surveillance_usv', 3.0)
-                elif 'strike' in platform_type.lower():
-                    cost_per = cost_per_platform.get('strike_usv', 4.0)
-                elif 'attack' in platform_type.lower():
-                    cost_per = cost_per_platform.get('attack_uuv', 5.0)
-                elif 'reconnaissance' in platform_type.lower():
-                    cost_per = cost_per_platform.get('reconnaissance_uuv', 2.0)
+                cost_key, default_cost = _cost_category(platform_type)
+                if cost_key is None:
+                    cost_per = default_cost  # Default cost
                 else:
-                    cost_per = 2.5  # Default cost
+                    cost_per = cost_per_platform.get(cost_key, default_cost)
                 estimated_cost += count * cost_per
         else:
             max_budget = constraints.get('max_budget_million_usd', 100.0)
@@ -297,6 +313,67 @@ def fitness_function(ga_instance, solution, solution_idx,
         return 0.001
 
 
+def fitness_function_batch(ga_instance, solutions, solutions_indices,
+                           indicator_config: Dict[str, Any],
+                           fuzzy_config: Dict[str, Any],
+                           expert_judgments: str,
+                           constraints: Dict[str, Any],
+                           gene_config: Dict[str, Any],
+                           fitness_cache: Optional[Dict[bytes, float]] = None,
+                           cache_size: int = 1000) -> np.ndarray:
+    """
+    Batched fitness function for PyGAD's ``fitness_batch_size`` mode.
+
+    Scores a whole (N, G) batch of chromosomes in one call. Identical
+    chromosomes (parents kept across generations, converged offspring) are
+    evaluated once and their fitness shared; every distinct chromosome gets
+    exactly the value ``fitness_function`` would return for it. With a
+    ``fitness_cache`` dict, chromosomes already scored in earlier batches
+    of the same run are looked up instead of re-evaluated.
+
+    Args:
+        ga_instance: PyGAD instance
+        solutions: Chromosome solutions, shape (N, G)
+        solutions_indices: Population indices of the solutions, shape (N,)
+        indicator_config: Indicator configuration
+        fuzzy_config: Fuzzy evaluation configuration
+        expert_judgments: Expert judgments file path
+        constraints: Constraint specifications
+        gene_config: Gene configuration
+        fitness_cache: Optional dict mapping chromosome bytes to fitness,
+            shared across calls; only valid for one set of configs
+        cache_size: Maximum cache entries, oldest evicted first
+
+    Returns:
+        Fitness scores, shape (N,)
+    """
+    solutions = np.atleast_2d(np.asarray(solutions))
+    solutions_indices = np.asarray(solutions_indices).reshape(-1)
+
+    unique_solutions, first_rows, inverse = np.unique(
+        solutions, axis=0, return_index=True, return_inverse=True
+    )
+
+    unique_fitness = np.empty(len(unique_solutions), dtype=np.float64)
+    for k, (solution, row) in enumerate(zip(unique_solutions, first_rows)):
+        key = solution.tobytes() if fitness_cache is not None else None
+        if key is not None and key in fitness_cache:
+            unique_fitness[k] = fitness_cache[key]
+            continue
+
+        fitness = fitness_function(ga_instance, solution, solutions_indices[row],
+                                   indicator_config, fuzzy_config, expert_judgments,
+                                   constraints, gene_config)
+        unique_fitness[k] = fitness
+
+        if key is not None:
+            if len(fitness_cache) >= cache_size:
+                fitness_cache.pop(next(iter(fitness_cache)))  # Evict the oldest entry
+            fitness_cache[key] = fitness
+
+    return unique_fitness[inverse.reshape(-1)]
+
+
 def calculate_population_diversity(population: np.ndarray) -> float:
     """
     Calculate population diversity metric using Hamming distance.
@@ -311,22 +388,26 @@ def calculate_population_diversity(population: np.ndarray) -> float:
         return 1.0
 
     try:
-        # Calculate average Hamming distance between all pairs
-        total_distance = 0.0
-        pair_count = 0
+        # Average Hamming distance over all pairs, counted per gene column: a
+        # column contributes every pair whose values differ, i.e. all pairs
+        # minus those inside a run of equal values once the column is sorted
+        population = np.asarray(population)
+        if np.all(population == population[0]):
+            return 0.0  # Converged population: every pair is identical
+
+        n, max_distance = population.shape[0], population.shape[1]  # Maximum Hamming distance
+        pair_count = n * (n - 1) // 2
 
-        for i in range(len(population)):
-            for j in range(i + 1, len(population)):
-                # Hamming distance for integer genes
-                distance = np.sum(population[i] != population[j])
-                total_distance += distance
-                pair_count += 1
+        sorted_genes = np.sort(population, axis=0)
+        positions = np.arange(n)[:, np.newaxis]
+        run_start = np.zeros(sorted_genes.shape, dtype=np.intp)
+        run_start[1:] = np.where(sorted_genes[1:] != sorted_genes[:-1], positions[1:], 0)
+        run_start = np.maximum.accumulate(run_start, axis=0)
+        equal_pairs = int((positions - run_start).sum())  # Earlier equal values per position
 
-        if pair_count == 0:
-            return 1.0
+        total_distance = max_distance * pair_count - equal_pairs
 
         # Normalize by maximum possible distance
-        max_distance = population.shape[1]  # Maximum Hamming distance
         avg_distance = total_distance / pair_count
         diversity = avg_distance / max_distance
 
@@ -347,7 +428,10 @@ def optimize_configuration(scenario_config: Dict[str, Any],
 
     Args:
         scenario_config: Scenario configuration
-        ga_params: Genetic algorithm parameters
+        ga_params: Genetic algorithm parameters. An optional
+            'parallel_processing' entry is passed to PyGAD; with process
+            workers each worker gets a pickled copy of the fitness cache, so
+            chromosomes are not reused across generations
         constraints: Constraint specifications
         indicator_config: Indicator configuration
         fuzzy_config: Fuzzy evaluation configuration
@@ -379,7 +463,8 @@ def optimize_configuration(scenario_config: Dict[str, Any],
                     platform_type = f"{platform_name}_Unmanned_Underwater_Vessel"
 
                 platform_types.append(platform_type)
-                platform_ranges.append({'low': gene['range'][0], 'high': gene['range'][1] + 1})  # +1 for inclusive range
+                platform_ranges.append({'low': gene['range'][0], 'high': gene['range'][1] + 1,  # +1 for inclusive range
+                                        'step': 1})
 
         gene_config = {
             'platform_types': platform_types,
@@ -396,7 +481,7 @@ def optimize_configuration(scenario_config: Dict[str, Any],
         gene_space = platform_ranges + [  # Platform counts from scenario
             {'low': 20, 'high': 80} for _ in range(num_deployment_genes)   # Coordinates
         ] + [
-            {'low': 1, 'high': 20} for _ in range(num_task_genes)         # Task assignments
+            {'low': 1, 'high': 20, 'step': 1} for _ in range(num_task_genes)  # Task assignments
         ]
 
         num_genes = len(gene_space)
@@ -446,19 +531,27 @@ def optimize_configuration(scenario_config: Dict[str, Any],
                       f"Avg Fitness: {avg_fitness:.4f} | "
                       f"Diversity: {diversity:.3f}")
 
-        # Create fitness function wrapper
-        def fitness_wrapper(ga_instance, solution, solution_idx):
-            return fitness_function(
-                ga_instance, solution, solution_idx,
+        # Create fitness function wrapper (scores a whole batch per call); the
+        # cache lets chromosomes seen in earlier generations skip evaluation
+        fitness_cache = {}
+
+        def fitness_wrapper(ga_instance, solutions, solutions_indices):
+            fitness = fitness_function_batch(
+                ga_instance, solutions, solutions_indices,
                 indicator_config, fuzzy_config, expert_judgments,
-                constraints, gene_config
+                constraints, gene_config,
+                fitness_cache, 10 * ga_params['population_size']
             )
+            # With a batch size of 1 PyGAD passes one chromosome and expects a scalar
+            return float(fitness[0]) if np.ndim(solutions) == 1 else fitness
 
         # Initialize PyGAD
         ga_instance = pygad.GA(
             num_generations=ga_params['num_generations'],
             num_parents_mating=ga_params['num_parents_mating'],
             fitness_func=fitness_wrapper,
+            fitness_batch_size=ga_params.get('fitness_batch_size') or _fitness_batch_size(
+                ga_params['population_size'], ga_params.get('parallel_processing')),
             sol_per_pop=ga_params['population_size'],
             num_genes=num_genes,
             gene_space=gene_space,
@@ -468,7 +561,8 @@ def optimize_configuration(scenario_config: Dict[str, Any],
             mutation_percent_genes=ga_params.get('mutation_percent_genes', 20),
             keep_parents=ga_params.get('keep_parents', 1),
             random_seed=42,
-            on_generation=on_generation
+            on_generation=on_generation,
+            parallel_processing=ga_params.get('parallel_processing')
         )
 
         # Run optimization
@@ -514,6 +608,31 @@ def optimize_configuration(scenario_config: Dict[str, Any],
         raise GAError(f"GA optimization failed: {e}")
 
 
+def _fitness_batch_size(population_size: int, parallel_processing: Any) -> int:
+    """
+    Split the population into one fitness batch per worker.
+
+    Args:
+        population_size: Number of solutions per generation
+        parallel_processing: PyGAD ``parallel_processing`` setting (None,
+            a worker count, or ``[executor_type, workers]``)
+
+    Returns:
+        Batch size handed to ``pygad.GA(fitness_batch_size=...)``; at least 2
+        (PyGAD treats 1 as unbatched) unless the population is a single solution
+    """
+    if parallel_processing is None:
+        return population_size
+
+    if isinstance(parallel_processing, (list, tuple)):
+        workers = parallel_processing[1] or os.cpu_count() or 1
+    else:
+        workers = parallel_processing
+
+    batch_size = max(2, math.ceil(population_size / max(1, workers)))
+    return min(batch_size, population_size)
+
+
 def _check_monotonic_improvement(fitness_history: List[float]) -> bool:
     """Check if fitness shows monotonic improvement."""
     if len(fitness_history) < 2:
@@ -90,7 +90,7 @@ def topsis_rank(decision_matrix: np.ndarray,
         Ci[zero_denominator_mask] = 0.5
 
     # Step 6: Rank alternatives based on Ci (higher Ci = better rank)
-    rankings = len(Ci) - np.argsort(Ci).argsort()  # Convert to 1-based ranking
+    rankings = _rank_by_closeness(Ci)  # 1-based ranking
 
     # Validate results
     validation_results = _validate_topsis_results(Ci, rankings, D_plus, D_minus)
@@ -108,6 +108,94 @@ def topsis_rank(decision_matrix: np.ndarray,
     }
 
 
+def topsis_rank_batch(decision_tensor: np.ndarray,
+                      weights: np.ndarray,
+                      indicator_types: List[str],
+                      validate_input: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Perform TOPSIS ranking on a batch of decision matrices in one vectorized pass.
+
+    Every matrix in the batch is ranked independently, exactly as topsis_rank
+    would rank it, but all matrices share the same weights and indicator types.
+    The result has topsis_rank's keys with a leading batch dimension, except
+    'validation': per-matrix result checks are not run here (use topsis_rank
+    on a single matrix when they are needed).
+
+    Args:
+        decision_tensor: Stack of decision matrices
+                         Shape: (B, m, n) where B = batch size, m = alternatives,
+                         n = indicators
+        weights: Weight vector for indicators (shape: n,)
+        indicator_types: List indicating each indicator type ('benefit' or 'cost')
+        validate_input: Whether to validate input data
+
+    Returns:
+        Dictionary containing:
+            'Ci': np.ndarray of relative closeness coefficients (shape: B, m)
+            'rankings': np.ndarray of rankings within each matrix (shape: B, m)
+            'PIS': np.ndarray of positive ideal solutions (shape: B, n)
+            'NIS': np.ndarray of negative ideal solutions (shape: B, n)
+            'D_plus': np.ndarray of distances to PIS (shape: B, m)
+            'D_minus': np.ndarray of distances to NIS (shape: B, m)
+            'normalized_matrix': np.ndarray of normalized matrices (shape: B, m, n)
+            'weighted_matrix': np.ndarray of weighted normalized matrices (shape: B, m, n)
+
+    Raises:
+        DataValidationError: If input data is invalid
+    """
+    decision_tensor = np.asarray(decision_tensor, dtype=float)
+    if decision_tensor.ndim != 3:
+        raise DataValidationError("Decision tensor must be 3-dimensional (batch × alternatives × indicators)")
+
+    if validate_input:
+        if decision_tensor.shape[0] == 0:
+            raise DataValidationError("Decision tensor must contain at least one matrix")
+        # Shape, weight and type checks are shared by every matrix in the batch,
+        # so the shared validator runs once; only negativity is checked per matrix
+        _validate_topsis_input(decision_tensor[0], weights, indicator_types)
+        if np.any(decision_tensor[1:] < 0):
+            raise DataValidationError("Decision tensor contains negative values")
+
+    benefit_mask = np.array([ind_type == 'benefit' for ind_type in indicator_types])
+
+    # Step 1: Vector normalization of each indicator column (same epsilon guard as vector_normalize)
+    safe_tensor = np.where(np.abs(decision_tensor) < 1e-12, 1e-12, decision_tensor)
+    normalized_tensor = safe_tensor / np.linalg.norm(safe_tensor, axis=1, keepdims=True)
+
+    # Step 2: Apply weights
+    weighted_tensor = normalized_tensor * weights
+
+    # Step 3: Ideal solutions per matrix
+    column_max = weighted_tensor.max(axis=1)
+    column_min = weighted_tensor.min(axis=1)
+    PIS = np.where(benefit_mask, column_max, column_min)
+    NIS = np.where(benefit_mask, column_min, column_max)
+
+    # Step 4: Distances to ideal solutions
+    D_plus = np.linalg.norm(weighted_tensor - PIS[:, np.newaxis, :], axis=2)
+    D_minus = np.linalg.norm(weighted_tensor - NIS[:, np.newaxis, :], axis=2)
+
+    # Step 5: Relative closeness, 0.5 where alternatives coincide with both ideals
+    denominator = D_plus + D_minus
+    zero_denominator_mask = denominator < 1e-15
+    Ci = np.divide(D_minus, denominator, out=np.full_like(denominator, 0.5),
+                   where=~zero_denominator_mask)
+
+    # Step 6: Rank within each matrix (higher Ci = better rank)
+    rankings = _rank_by_closeness(Ci)
+
+    return {
+        'Ci': Ci,
+        'rankings': rankings,
+        'PIS': PIS,
+        'NIS': NIS,
+        'D_plus': D_plus,
+        'D_minus': D_minus,
+        'normalized_matrix': normalized_tensor,
+        'weighted_matrix': weighted_tensor
+    }
+
+
 def identify_ideal_solutions(weighted_matrix: np.ndarray,
                           indicator_types: List[str]) -> Tuple[np.ndarray, np.ndarray]:
     """
@@ -152,6 +240,27 @@ def identify_ideal_solutions(weighted_matrix: np.ndarray,
     return PIS, NIS
 
 
+def _rank_by_closeness(Ci: np.ndarray) -> np.ndarray:
+    """
+    Rank alternatives by relative closeness along the last axis.
+
+    One stable argsort by descending Ci, then ranks 1..m scattered into
+    place, so tied alternatives are ranked in input order and the best
+    alternative is the first occurrence of the maximum Ci.
+
+    Args:
+        Ci: Relative closeness coefficients, shape (m,) or (batch, m)
+
+    Returns:
+        1-based rankings with the same shape as Ci
+    """
+    order = np.argsort(-Ci, axis=-1, kind='stable')
+    positions = np.broadcast_to(np.arange(1, Ci.shape[-1] + 1), Ci.shape)
+    rankings = np.empty(Ci.shape, dtype=np.intp)
+    np.put_along_axis(rankings, order, positions, axis=-1)
+    return rankings
+
+
 def _validate_topsis_input(decision_matrix: np.ndarray,
                           weights: np.ndarray,
                           indicator_types: List[str]) -> None:
@@ -199,6 +308,11 @@ def _validate_topsis_input(decision_matrix: np.ndarray,
     if len(indicator_types) != n:
         raise DataValidationError(f"Indicator types length ({len(indicator_types)}) must match number of indicators ({n})")
 
+    valid_types = {'benefit', 'cost'}
+    for ind_type in indicator_types:
+        if ind_type not in valid_types:
+            raise DataValidationError(f"Invalid indicator type: {ind_type}. Must be 'benefit' or 'cost'")
+
 
 def _validate_topsis_results(Ci: np.ndarray,
                            rankings: np.ndarray,
@@ -242,7 +356,7 @@ def _validate_topsis_results(Ci: np.ndarray,
         validation['warnings'].append("Some distances to ideal solutions are zero or negative")
 
     # Check Ci ordering (higher Ci should have better rank)
-    sorted_ci_indices = np.argsort(-Ci)  # Sort by Ci descending
+    sorted_ci_indices = np.argsort(-Ci, kind='stable')  # Sort by Ci descending
     expected_rankings = np.arange(1, len(Ci) + 1)
     actual_rankings_sorted = rankings[sorted_ci_indices]
 
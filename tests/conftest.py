@@ -13,10 +13,13 @@ import tempfile
 from pathlib import Path
 from typing import Dict, Any, List
 import warnings
+from hypothesis import settings
 
-# Add parent directory to path for imports
+# Put the repository root on sys.path once for every test module
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
 
 from modules.ahp_module import calculate_weights, validate_judgment_matrix
 from modules.fce_module import fuzzy_evaluate
@@ -221,6 +224,14 @@ def math_validator():
 
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
+    # Hypothesis profiles, selected with --hypothesis-profile. "ci" is
+    # derandomized so pytest-xdist workers (-n auto) share one example corpus.
+    settings.register_profile("ci", max_examples=1000, derandomize=True)
+    settings.register_profile("dev", max_examples=100)
+    # Parent profile for individual tests whose every example runs a full
+    # TOPSIS evaluation; applied per test with @settings(parent=...)
+    settings.register_profile("heavy", max_examples=25, deadline=5000)
+
     config.addinivalue_line(
         "markers", "mathematical: Tests focusing on mathematical precision and algorithm correctness"
     )
@@ -233,6 +244,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "validation: System validation and integrity tests"
     )
+    config.addinivalue_line(
+        "markers", "slow: Extreme-value and long-running tests, deselect with -m \"not slow\""
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -19,11 +19,7 @@ from hypothesis import given, strategies as st, assume
 import warnings
 from typing import Dict, List, Tuple, Any
 
-# Add parent directory to path for imports
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
+# The repository root is put on sys.path once, by tests/conftest.py
 from modules.fce_module import (
     fuzzy_comprehensive_evaluation,
     apply_fuzzy_scale,
@@ -45,7 +41,7 @@ class TestFCEFuzzySetProperties:
         degrees_array = np.array(degrees)
 
         # Property 1: All membership degrees should be in [0, 1]
-        assert all(0.0 <= d <= 1.0 for d in degrees_array), \
+        assert ((degrees_array >= 0.0) & (degrees_array <= 1.0)).all(), \
             f"All membership degrees should be in [0, 1], got {degrees_array}"
 
         # Property 2: Normalized degrees should sum to 1.0
@@ -99,8 +95,8 @@ class TestFCEFuzzySetProperties:
         fuzzy_intersection = np.minimum(arr1, arr2)
 
         # Property 1: Union and intersection bounds
-        assert all(0.0 <= x <= 1.0 for x in fuzzy_union), "Union should be in [0, 1]"
-        assert all(0.0 <= x <= 1.0 for x in fuzzy_intersection), "Intersection should be in [0, 1]"
+        assert ((fuzzy_union >= 0.0) & (fuzzy_union <= 1.0)).all(), "Union should be in [0, 1]"
+        assert ((fuzzy_intersection >= 0.0) & (fuzzy_intersection <= 1.0)).all(), "Intersection should be in [0, 1]"
 
         # Property 2: Union should be >= each operand
         assert all(fuzzy_union >= arr1), "Union should be >= first operand"
@@ -198,7 +194,7 @@ class TestFCEMembershipFunctionProperties:
             f"Normalized degrees should sum to 1.0, got {sum(normalized)}"
 
         # Property 2: Individual degrees should remain in [0, 1]
-        assert all(0.0 <= d <= 1.0 for d in normalized), \
+        assert ((normalized >= 0.0) & (normalized <= 1.0)).all(), \
             f"Normalized degrees should be in [0, 1], got {normalized}"
 
         # Property 3: Order should be preserved
@@ -290,7 +286,7 @@ class TestFCEDefuzzificationProperties:
         # Property 3: If all weights are equal, should equal simple average
         equal_weights = np.ones_like(weights_array) / len(weights_array)
         simple_avg = sum(equal_weights * values_array)
-        if all(abs(w - equal_weights[0]) < 1e-10 for w in normalized_weights):
+        if (np.abs(normalized_weights - equal_weights[0]) < 1e-10).all():
             assert abs(weighted_avg - simple_avg) < 1e-10, \
                 "Equal weights should give simple average"
 
@@ -345,7 +341,7 @@ class TestFCEComprehensiveEvaluationProperties:
         weights = weights / sum(weights)  # Normalize
 
         # Property 1: Evaluation matrix should be in [0, 1]
-        assert all(0.0 <= x <= 1.0 for x in evaluation_matrix.flatten()), \
+        assert ((evaluation_matrix >= 0.0) & (evaluation_matrix <= 1.0)).all(), \
             "Evaluation matrix values should be in [0, 1]"
 
         # Property 2: Weights should sum to 1.0
@@ -353,7 +349,7 @@ class TestFCEComprehensiveEvaluationProperties:
 
         # Property 3: Weighted evaluation should be in [0, 1]
         weighted_eval = np.dot(evaluation_matrix, weights)
-        assert all(0.0 <= x <= 1.0 for x in weighted_eval), \
+        assert ((weighted_eval >= 0.0) & (weighted_eval <= 1.0)).all(), \
             "Weighted evaluation should be in [0, 1]"
 
     @given(
@@ -386,11 +382,11 @@ class TestFCEComprehensiveEvaluationProperties:
             "Should have min <= avg <= max"
 
         # Property 3: Boundary conditions
-        if all(v == 0.0 for v in values_array):
+        if (values_array == 0.0).all():
             assert max_result == 0.0 and min_result == 0.0 and avg_result == 0.0, \
                 "All zeros should give all zero aggregations"
 
-        if all(v == 1.0 for v in values_array):
+        if (values_array == 1.0).all():
             assert max_result == 1.0 and min_result == 1.0 and avg_result == 1.0, \
                 "All ones should give all one aggregations"
 
@@ -414,7 +410,7 @@ class TestFCEComprehensiveEvaluationProperties:
         num_array = np.array(numerical_values)
 
         # Property 1: Transformed values should be in [0, 1]
-        assert all(0.0 <= v <= 1.0 for v in numerical_values), \
+        assert ((num_array >= 0.0) & (num_array <= 1.0)).all(), \
             "Transformed values should be in [0, 1]"
 
         # Property 2: Order preservation
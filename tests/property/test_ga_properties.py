@@ -16,8 +16,10 @@ Key Properties Validated:
 
 import pytest
 import numpy as np
+import pygad
 from hypothesis import given, strategies as st, assume
 import warnings
+from functools import lru_cache
 from typing import Dict, List, Tuple, Any
 
 # Add parent directory to path for imports
@@ -53,6 +55,27 @@ except ImportError:
         return solution.get('platform_counts', [1, 2, 3])
 
 
+# Seeded generator shared by the simulated populations below
+RNG = np.random.default_rng(42)
+
+
+def _corr(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation of two 1-D arrays without building a corrcoef matrix."""
+    xm = x - x.mean()
+    ym = y - y.mean()
+    return float(xm @ ym / (np.linalg.norm(xm) * np.linalg.norm(ym) + 1e-12))
+
+
+@lru_cache(maxsize=2048)
+def _roundtrip(chrom_tuple: Tuple[int, ...]):
+    """Encode then decode a chromosome, memoised across Hypothesis replays."""
+    solution = encode_chromosome({'platform_counts': list(chrom_tuple)})
+    decoded = decode_chromosome(solution)
+    if isinstance(decoded, dict):
+        return tuple(decoded.get('platform_counts', []))
+    return decoded
+
+
 class TestGAFundamentalProperties:
     """Test fundamental mathematical properties of genetic algorithms."""
 
@@ -63,18 +86,10 @@ class TestGAFundamentalProperties:
     def test_chromosome_encoding_decoding_invariant(self, chromosome):
         """Test that chromosome encoding and decoding are inverse operations."""
         try:
-            # Encode chromosome to solution
-            solution = encode_chromosome({'platform_counts': chromosome})
-
-            # Decode solution back to chromosome
-            decoded_chromosome = decode_chromosome(solution)
-
+            # Encode chromosome to solution and decode it back (cached per chromosome)
             # Invariant: decode(encode(chromosome)) should equal original chromosome
             # (or be mathematically equivalent)
-            if isinstance(decoded_chromosome, dict):
-                decoded_counts = decoded_chromosome.get('platform_counts', [])
-            else:
-                decoded_counts = decoded_chromosome
+            decoded_counts = _roundtrip(tuple(chromosome))
 
             # Check mathematical equivalence (allowing for different representations)
             assert len(decoded_counts) == len(chromosome), \
@@ -125,7 +140,7 @@ class TestGAFundamentalProperties:
         assume(population_size >= 3 and gene_range >= 2)
 
         # Generate a random population
-        population = np.random.randint(0, 10, (population_size, gene_range))
+        population = RNG.integers(0, 10, (population_size, gene_range), dtype=np.int8)
 
         # Calculate diversity metrics
         gene_variances = np.var(population, axis=0)
@@ -135,7 +150,7 @@ class TestGAFundamentalProperties:
         assert overall_diversity >= 0, "Overall diversity should be non-negative"
 
         # Property 2: Individual gene diversities should be non-negative
-        assert all(d >= 0 for d in gene_variances), "Individual gene diversities should be non-negative"
+        assert np.all(gene_variances >= 0), "Individual gene diversities should be non-negative"
 
         # Property 3: Identical population should have zero diversity
         if len(set(tuple(row) for row in population)) == 1:  # All identical
@@ -163,15 +178,15 @@ class TestGASelectionProperties:
         fitness_values = np.random.uniform(0.1, fitness_range, population_size)
 
         # Calculate selection probabilities
-        total_fitness = sum(fitness_values)
+        total_fitness = np.sum(fitness_values)
         selection_probs = fitness_values / total_fitness
 
         # Property 1: Selection probabilities should sum to 1.0
-        assert abs(sum(selection_probs) - 1.0) < 1e-10, \
-            f"Selection probabilities should sum to 1.0, got {sum(selection_probs)}"
+        assert abs(np.sum(selection_probs) - 1.0) < 1e-10, \
+            f"Selection probabilities should sum to 1.0, got {np.sum(selection_probs)}"
 
         # Property 2: All probabilities should be in [0, 1]
-        assert all(0.0 <= p <= 1.0 for p in selection_probs), \
+        assert np.all((selection_probs >= 0.0) & (selection_probs <= 1.0)), \
             "All selection probabilities should be in [0, 1]"
 
         # Property 3: Higher fitness should have higher selection probability
@@ -198,7 +213,7 @@ class TestGASelectionProperties:
         assume(tournament_size <= population_size)
 
         # Generate random fitness values
-        fitness_values = np.random.uniform(0.0, 1.0, population_size)
+        fitness_values = RNG.random((population_size,), dtype=np.float32)
 
         # Simulate tournament selection multiple times
         selection_counts = np.zeros(population_size)
@@ -218,12 +233,12 @@ class TestGASelectionProperties:
         selection_probs = selection_counts / num_trials
 
         # Property 1: Selection probabilities should sum to 1.0
-        assert abs(sum(selection_probs) - 1.0) < 1e-10, \
+        assert abs(np.sum(selection_probs) - 1.0) < 1e-10, \
             "Tournament selection probabilities should sum to 1.0"
 
         # Property 2: Higher fitness should generally have higher selection probability
         # (statistical property, not guaranteed in small samples)
-        correlation = np.corrcoef(fitness_values, selection_probs)[0, 1]
+        correlation = _corr(fitness_values, selection_probs)
 
         # Should have positive correlation (allowing for statistical variance)
         assert correlation > -0.5, \
@@ -242,20 +257,20 @@ class TestGASelectionProperties:
     def test_rank_based_selection_properties(self, population_size, selection_pressure):
         """Test mathematical properties of rank-based selection."""
         # Generate random fitness values and rank them
-        fitness_values = np.random.uniform(0.0, 1.0, population_size)
+        fitness_values = RNG.random((population_size,), dtype=np.float32)
         ranks = np.argsort(np.argsort(fitness_values)) + 1  # 1-based ranks
 
         # Calculate rank-based selection probabilities
         # Using exponential ranking: p(i) = exp(sp * rank(i)) / sum(exp(sp * rank))
         exp_values = np.exp(selection_pressure * ranks)
-        selection_probs = exp_values / sum(exp_values)
+        selection_probs = exp_values / np.sum(exp_values)
 
         # Property 1: Selection probabilities should sum to 1.0
-        assert abs(sum(selection_probs) - 1.0) < 1e-10, \
+        assert abs(np.sum(selection_probs) - 1.0) < 1e-10, \
             "Rank-based selection probabilities should sum to 1.0"
 
         # Property 2: All probabilities should be in [0, 1]
-        assert all(0.0 <= p <= 1.0 for p in selection_probs), \
+        assert np.all((selection_probs >= 0.0) & (selection_probs <= 1.0)), \
             "All selection probabilities should be in [0, 1]"
 
         # Property 3: Higher rank (better fitness) should have higher probability
@@ -341,7 +356,7 @@ class TestGAGeneticOperators:
 
         # Property 2: Mutation rate should affect number of changes
         # (statistical property, allowing for variance)
-        num_changes = sum(original != mutated)
+        num_changes = np.sum(original != mutated)
         expected_changes = len(original) * mutation_rate
 
         # Allow statistical variance
@@ -369,8 +384,8 @@ class TestGAGeneticOperators:
         assume(elite_size < population_size)
 
         # Generate random population and fitness
-        population = np.random.randint(0, 10, (population_size, 5))
-        fitness_values = np.random.uniform(0.0, 1.0, population_size)
+        population = RNG.integers(0, 10, (population_size, 5), dtype=np.int8)
+        fitness_values = RNG.random((population_size,), dtype=np.float32)
 
         # Identify elite individuals (top fitness)
         elite_indices = np.argsort(fitness_values)[-elite_size:]
@@ -383,8 +398,8 @@ class TestGAGeneticOperators:
 
         # Remaining individuals generated through genetic operators
         # (simplified - just random for this test)
-        new_population[elite_size:] = np.random.randint(0, 10,
-                                                      (population_size - elite_size, 5))
+        new_population[elite_size:] = RNG.integers(0, 10, (population_size - elite_size, 5),
+                                                   dtype=np.int8)
 
         # Property 1: Elite individuals should be preserved exactly
         np.testing.assert_array_equal(new_population[:elite_size], elite_individuals,
@@ -396,7 +411,7 @@ class TestGAGeneticOperators:
 
         # Property 3: Elite fitness should be preserved in new population
         elite_fitness = fitness_values[elite_indices]
-        new_fitness = np.random.uniform(0.0, 1.0, population_size)
+        new_fitness = RNG.random((population_size,), dtype=np.float32)
         new_fitness[:elite_size] = elite_fitness  # Elites keep their fitness
 
         # Best fitness should not decrease with elitism
@@ -417,10 +432,12 @@ class TestGAConvergenceProperties:
     def test_fitness_improvement_properties(self, generations, population_size):
         """Test mathematical properties of fitness improvement over generations."""
         # Simulate GA evolution with selection pressure
-        np.random.seed(42)  # For reproducible testing
+        rng = np.random.default_rng(42)  # For reproducible testing
 
-        # Start with random population
-        population = np.random.uniform(0.0, 1.0, population_size)
+        # Start with random population; mutation noise for every generation is
+        # drawn in one call, so the seeded stream stays deterministic
+        population = rng.random(population_size)
+        all_noise = rng.normal(0.0, 0.1, size=(generations, population_size)).astype(np.float32)
         best_fitness_history = []
 
         for gen in range(generations):
@@ -436,12 +453,8 @@ class TestGAConvergenceProperties:
             top_indices = sorted_indices[population_size // 2:]
 
             # Reproduction: mutate top performers
-            population = np.zeros(population_size)
-            for i in range(population_size):
-                parent = population[top_indices[i % len(top_indices)]]
-                # Small mutation
-                mutation = np.random.normal(0, 0.1)
-                population[i] = np.clip(parent + mutation, 0.0, 1.0)
+            parents = population[top_indices[np.arange(population_size) % len(top_indices)]]
+            population = np.clip(parents + all_noise[gen], 0.0, 1.0)
 
         # Property 1: Best fitness should be non-decreasing (with elitism)
         # Since we're simulating selection, this should generally hold
@@ -453,7 +466,7 @@ class TestGAConvergenceProperties:
 
         # Property 2: Convergence should be bounded above
         max_possible_fitness = 1.0  # Based on our population generation
-        assert all(fitness <= max_possible_fitness for fitness in best_fitness_history), \
+        assert np.all(np.asarray(best_fitness_history) <= max_possible_fitness), \
             "Fitness should be bounded above by theoretical maximum"
 
         # Property 3: Fitness should show some improvement trend
@@ -478,8 +491,10 @@ class TestGAConvergenceProperties:
         gene_length = 5
 
         # Generate initial population with specified diversity
-        population = np.random.normal(0.5, initial_diversity, (population_size, gene_length))
+        population = RNG.normal(0.5, initial_diversity, (population_size, gene_length))
         population = np.clip(population, 0.0, 1.0)  # Keep in [0, 1]
+        # One small mutation per individual, applied across all of its genes
+        all_noise = RNG.normal(0.0, 0.05, size=(generations, population_size, 1))
 
         diversity_history = []
 
@@ -495,14 +510,9 @@ class TestGAConvergenceProperties:
             # Selection pressure tends to reduce diversity
             top_indices = np.argsort(fitness_values)[population_size // 2:]
 
-            # Create new generation from top performers
-            new_population = np.zeros_like(population)
-            for i in range(population_size):
-                parent = population[top_indices[i % len(top_indices)]]
-                mutation = np.random.normal(0, 0.05)  # Small mutation
-                new_population[i] = np.clip(parent + mutation, 0.0, 1.0)
-
-            population = new_population
+            # Create new generation from top performers with small mutations
+            parents = population[top_indices[np.arange(population_size) % len(top_indices)]]
+            population = np.clip(parents + all_noise[gen], 0.0, 1.0)
 
         # Property 1: Diversity should generally decrease with selection pressure
         if generations >= 5:
@@ -515,12 +525,12 @@ class TestGAConvergenceProperties:
                 f"Diversity should not increase significantly: {reduction_factor}"
 
         # Property 2: Diversity should remain non-negative
-        assert all(diversity >= 0 for diversity in diversity_history), \
+        assert np.all(np.asarray(diversity_history) >= 0), \
             "Diversity should always be non-negative"
 
         # Property 3: Diversity should be bounded
         max_theoretical_diversity = 0.25  # Maximum variance for [0, 1] range
-        assert all(diversity <= max_theoretical_diversity for diversity in diversity_history), \
+        assert np.all(np.asarray(diversity_history) <= max_theoretical_diversity), \
             "Diversity should be theoretically bounded"
 
     @given(
@@ -553,7 +563,7 @@ class TestGAConvergenceProperties:
             # Selection with pressure
             # Higher selection pressure means favoring top performers more
             selection_probs = np.power(fitness_values, selection_pressure)
-            selection_probs /= sum(selection_probs)
+            selection_probs /= np.sum(selection_probs)
 
             # Create new generation
             new_population = np.zeros_like(population)
@@ -674,52 +684,44 @@ class TestGAEdgeCaseGeneration:
     )
     def test_identical_population_scenarios(self, population_size, identical_chromosome):
         """Test GA behavior with identical initial populations."""
-        # Create identical population
-        population = np.tile(identical_chromosome, (population_size, 1))
+        # Identical population: every row is the same chromosome (np.full
+        # broadcasts it, no np.tile), with fitness computed per row
+        population = np.full((population_size, len(identical_chromosome)), identical_chromosome)
+        fitness_values = population.sum(axis=1).astype(np.float64)
 
-        try:
-            # Calculate fitness (same for all individuals)
-            fitness_values = np.sum(population, axis=1)
-
-            # All fitness values should be identical
-            assert all(f == fitness_values[0] for f in fitness_values), \
-                "All fitness values should be identical for identical population"
+        # All fitness values should be identical
+        assert np.all(fitness_values == fitness_values[0]), \
+            "All fitness values should be identical for identical population"
 
-            # Selection probabilities should be uniform
-            selection_probs = fitness_values / sum(fitness_values)
-            expected_prob = 1.0 / population_size
+        # Selection probabilities should be uniform
+        total = fitness_values.sum()
+        selection_probs = fitness_values / total
+        expected_prob = 1.0 / population_size
 
-            assert all(abs(p - expected_prob) < 1e-10 for p in selection_probs), \
-                "Selection should be uniform for identical fitness"
+        assert np.all(np.abs(selection_probs - expected_prob) < 1e-10), \
+            "Selection should be uniform for identical fitness"
 
-        except Exception as e:
-            # Some operations might not work with zero diversity
-            pass
-
-    @given(
-        # Test with single-gene chromosomes
-        single_gene_value=st.integers(min_value=0, max_value=10)
-    )
-    def test_single_gene_chromosomes(self, single_gene_value):
+    @pytest.mark.parametrize('v', [0, 5, 10])
+    def test_single_gene_chromosomes(self, v):
         """Test GA behavior with single-gene chromosomes."""
-        chromosome = np.array([single_gene_value])
-
-        try:
-            # Basic operations should work with single gene
-            assert len(chromosome) == 1, "Single-gene chromosome should have length 1"
-
-            # Mutation
-            mutated = chromosome.copy()
-            mutated[0] = np.random.randint(0, 11)
-            assert len(mutated) == 1, "Mutation should preserve length"
-
-            # Fitness calculation
-            fitness = np.sum(chromosome)
-            assert np.isfinite(fitness), "Fitness should be finite"
-
-        except Exception as e:
-            # Some operators might require minimum chromosome length
-            pass
+        chromosome = np.array([v])
+
+        assert len(chromosome) == 1, "Single-gene chromosome should have length 1"
+
+        # Mutate with PyGAD's random mutation over an integer gene space, as
+        # optimize_configuration sets up its count genes
+        ga_instance = pygad.GA(num_generations=1, num_parents_mating=1,
+                               fitness_func=lambda ga, solution, idx: 0.0,
+                               sol_per_pop=2, num_genes=1,
+                               gene_space=[{'low': 0, 'high': 11, 'step': 1}],
+                               mutation_type='random', mutation_num_genes=1,
+                               random_seed=v, suppress_warnings=True)
+        mutated = ga_instance.mutation(chromosome[np.newaxis, :].astype(np.float64))[0]
+
+        assert mutated.shape == chromosome.shape, "Mutation should preserve length"
+        assert 0 <= mutated[0] <= 10 and mutated[0] == int(mutated[0]), \
+            "Mutated gene should stay an integer within the gene space"
+        assert np.isfinite(np.sum(chromosome)), "Fitness should be finite"
 
 
 # Configure Hypothesis settings
@@ -17,8 +17,10 @@ Key Properties Validated:
 
 import pytest
 import numpy as np
-from hypothesis import given, strategies as st, assume
-from typing import Dict, Any, List
+from functools import lru_cache
+from hypothesis import given, example, strategies as st, assume
+from hypothesis.extra.numpy import arrays, array_shapes
+from typing import Dict, Any, List, Tuple
 import warnings
 
 # Add parent directory to path for imports
@@ -31,114 +33,144 @@ from modules.ahp_module import calculate_weights, validate_judgment_matrix
 from modules.ahp_module import JudgmentMatrixError
 
 
+@lru_cache(maxsize=2048)
+def _topsis_cached(mat_bytes: bytes, mat_shape: Tuple[int, int], weights_bytes: bytes,
+                   n_weights: int, types_tuple: Tuple[str, ...]) -> Dict[str, Any]:
+    """Run topsis_rank on arrays rebuilt from their raw bytes (memoised)."""
+    decision_matrix = np.frombuffer(mat_bytes, dtype=np.float64).reshape(mat_shape)
+    weights = np.frombuffer(weights_bytes, dtype=np.float64, count=n_weights)
+    return topsis_rank(decision_matrix, weights, list(types_tuple))
+
+
+def _cached_topsis_rank(decision_matrix: np.ndarray, weights: np.ndarray,
+                        indicator_types: List[str]) -> Dict[str, Any]:
+    """topsis_rank with results shared across repeated Hypothesis inputs."""
+    decision_matrix = np.ascontiguousarray(decision_matrix, dtype=np.float64)
+    weights = np.ascontiguousarray(weights, dtype=np.float64)
+    return _topsis_cached(decision_matrix.tobytes(), decision_matrix.shape,
+                          weights.tobytes(), len(weights), tuple(indicator_types))
+
+
+@lru_cache(maxsize=16)
+def _calc_weights_uniform(size: int) -> Dict[str, Any]:
+    """calculate_weights on the size x size all-ones (uniform, perfectly consistent) matrix, memoised per size."""
+    return calculate_weights(np.ones((size, size)))
+
+
+@st.composite
+def _topsis_inputs(draw, max_alts: int = 10, max_crit: int = 8, max_value: float = 100.0,
+                   min_value: float = 0.0):
+    """Draw a decision matrix, normalised weights and indicator types of matching size."""
+    n = draw(st.integers(min_value=2, max_value=max_crit))
+    m = draw(st.integers(min_value=2, max_value=max_alts))
+    decision_matrix = draw(arrays(np.float64, (m, n),
+                                  elements=st.floats(min_value=min_value, max_value=max_value,
+                                                     allow_nan=False, allow_infinity=False)))
+    raw_weights = draw(arrays(np.float64, n,
+                              elements=st.floats(min_value=0.01, max_value=1.0,
+                                                 allow_nan=False, allow_infinity=False)))
+    indicator_types = draw(st.lists(st.sampled_from(['benefit', 'cost']), min_size=n, max_size=n))
+    return decision_matrix, raw_weights / raw_weights.sum(), indicator_types
+
+
+@pytest.fixture(scope='session')
+def _scratch():
+    """Preallocated buffers that property tests fill in place between examples."""
+    return {'mat': np.empty((10, 8)), 'w': np.empty(8), 'imp': np.empty((10, 8))}
+
+
 class TestTOPSISPropertyBasedValidation:
     """Property-based testing for TOPSIS algorithm mathematical correctness."""
 
     @given(
-        # Generate random decision matrices
-        decision_matrix=st.lists(
-            st.lists(st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-            min_size=2,  # Minimum 2 alternatives
-            max_size=10,  # Reasonable upper bound
-            min_size=2,  # Minimum 2 criteria
-            max_size=8   # Reasonable upper bound
-        ).map(np.array),
-        # Generate random weight vectors
-        weights=st.lists(st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False),
-                    min_size=2, max_size=8).map(lambda w: np.array(w) / np.sum(w)),
-        # Generate random indicator types
-        indicator_types=st.lists(st.sampled_from(['benefit', 'cost']), min_size=2, max_size=8)
+        # 2-10 alternatives x 2-8 criteria with matching weights and indicator types
+        inp=_topsis_inputs()
     )
-    def test_topsis_mathematical_properties(self, decision_matrix, weights, indicator_types):
+    def test_topsis_mathematical_properties(self, inp):
         """Test TOPSIS mathematical properties with random inputs."""
-        # Ensure dimensions match
-        assume(decision_matrix.shape[1] == len(weights) == len(indicator_types))
-        assume(decision_matrix.shape[0] >= 2)  # Need at least 2 alternatives
+        decision_matrix, weights, indicator_types = inp
 
         # Run TOPSIS
-        result = topsis_rank(decision_matrix, weights, indicator_types)
+        result = _cached_topsis_rank(decision_matrix, weights, indicator_types)
         ci_scores = result['Ci']
         rankings = result['rankings']
 
         n_alternatives = len(ci_scores)
 
         # Property 1: Ci scores should be in [0, 1] range
-        assert all(0.0 <= ci <= 1.0 for ci in ci_scores), f"Ci scores must be in [0,1], got {ci_scores}"
+        assert np.all((ci_scores >= 0.0) & (ci_scores <= 1.0)), f"Ci scores must be in [0,1], got {ci_scores}"
 
         # Property 2: Rankings should be a complete permutation of 1..n
         expected_rankings = set(range(1, n_alternatives + 1))
         actual_rankings = set(rankings)
         assert actual_rankings == expected_rankings, f"Rankings must be complete permutation"
 
-        # Property 3: Higher Ci must always get better rank
-        for i in range(n_alternatives):
-            for j in range(n_alternatives):
-                if ci_scores[i] > ci_scores[j] + 1e-10:  # Add small epsilon for floating point
-                    assert rankings[i] < rankings[j], f"Higher Ci should get better rank"
+        # Property 3: Higher Ci must always get better rank (small epsilon for floating point)
+        better_ci = ci_scores[:, np.newaxis] > ci_scores[np.newaxis, :] + 1e-10
+        not_better_rank = rankings[:, np.newaxis] >= rankings[np.newaxis, :]
+        assert not np.any(better_ci & not_better_rank), "Higher Ci should get better rank"
 
         # Property 4: Best scheme index should be mathematically correct
         best_rank_idx = np.argmin(rankings)
         best_ci_idx = np.argmax(ci_scores)
-        assert best_rank_idx == best_ci_idx, "Best rank and best Ci should point to same alternative"
+        # (compare Ci values, since tied alternatives may legitimately swap indices)
+        assert ci_scores[best_rank_idx] == ci_scores[best_ci_idx], \
+            "Best rank and best Ci should point to same alternative"
 
         # Property 5: Array bounds validation
         assert all(0 <= idx < n_alternatives for idx in [best_rank_idx, best_ci_idx]), "Indices should be in bounds"
 
-    @given(
-        decision_matrix=st.lists(
-            st.lists(st.floats(min_value=0.0, max_value=1000.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=5, min_size=2, max_size=5
-        ).map(np.array),
-        weights=st.lists(st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False),
-                    min_size=2, max_size=5).map(lambda w: np.array(w) / np.sum(w)),
-        indicator_types=st.lists(st.sampled_from(['benefit', 'cost']), min_size=2, max_size=5)
-    )
-    def test_topsis_numerical_stability(self, decision_matrix, weights, indicator_types):
+    @pytest.mark.parametrize('scale', [1.0, 100.0, 1e-3])
+    # Entries stay well above the 1e-12 floor vector_normalize substitutes for
+    # near-zero values at every scale; that floor is deliberately not scale-invariant
+    @given(inp=_topsis_inputs(max_alts=5, max_crit=5, max_value=1000.0, min_value=1.0))
+    def test_topsis_numerical_stability(self, scale, inp):
         """Test numerical stability with various input scales."""
-        assume(decision_matrix.shape[1] == len(weights) == len(indicator_types))
-        assume(decision_matrix.shape[0] >= 2)
-
-        # Test with original values
-        result1 = topsis_rank(decision_matrix, weights, indicator_types)
-
-        # Test with scaled values (should produce same rankings)
-        scaled_matrix = decision_matrix * 100.0
-        result2 = topsis_rank(scaled_matrix, weights, indicator_types)
-
-        # Rankings should be identical despite scaling
-        np.testing.assert_array_equal(result1['rankings'], result2['rankings'],
-                                    "Rankings should be scale-invariant")
-
-        # Test with small values
-        tiny_matrix = decision_matrix / 1000.0
-        result3 = topsis_rank(tiny_matrix, weights, indicator_types)
-
-        # Should not produce NaN or Inf
-        assert not np.any(np.isnan(result3['Ci'])), "Tiny values should not produce NaN"
-        assert not np.any(np.isinf(result3['Ci'])), "Tiny values should not produce Inf"
+        decision_matrix, weights, indicator_types = inp
+
+        # Baseline with original values (shared between scales via the cache)
+        baseline = _cached_topsis_rank(decision_matrix, weights, indicator_types)
+        result = _cached_topsis_rank(decision_matrix * scale, weights, indicator_types)
+
+        # Should not produce NaN or Inf at any scale
+        assert not np.any(np.isnan(result['Ci'])), f"Scale {scale} should not produce NaN"
+        assert not np.any(np.isinf(result['Ci'])), f"Scale {scale} should not produce Inf"
+
+        # Ci (and so the ranking) should be invariant under upscaling. Ci values
+        # within rounding of each other may legitimately swap ranks, so rank
+        # order is only checked for pairs separated by more than the tolerance
+        if scale >= 1.0:
+            np.testing.assert_allclose(result['Ci'], baseline['Ci'], rtol=0, atol=1e-12,
+                                       err_msg="Ci should be scale-invariant")
+            ci, ranks = baseline['Ci'], result['rankings']
+            separated = ci[:, np.newaxis] > ci[np.newaxis, :] + 1e-12
+            assert np.all(ranks[:, np.newaxis] < ranks[np.newaxis, :], where=separated), \
+                "Rankings should be scale-invariant"
 
     @given(
-        matrix=st.lists(
-            st.lists(st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=3, min_size=2, max_size=3
-        ).map(np.array)
+        matrix=arrays(np.float64, array_shapes(min_dims=2, max_dims=2, min_side=2, max_side=3),
+                      elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
     )
-    def test_identical_alternatives_property(self, matrix):
+    def test_identical_alternatives_property(self, _scratch, matrix):
         """Test property: identical alternatives should have similar rankings."""
         n_alternatives, n_criteria = matrix.shape
         assume(n_alternatives >= 2)
 
-        # Create identical alternatives by copying the first row
-        identical_matrix = np.tile(matrix[0:1], (n_alternatives, 1))
-        weights = np.ones(n_criteria) / n_criteria
+        # Create identical alternatives by broadcasting the first row into scratch
+        identical_matrix = _scratch['mat'][:n_alternatives, :n_criteria]
+        identical_matrix[...] = matrix[0]
+        weights = _scratch['w'][:n_criteria]
+        weights.fill(1.0 / n_criteria)
         indicator_types = ['benefit'] * n_criteria
 
-        result = topsis_rank(identical_matrix, weights, indicator_types)
+        result = _cached_topsis_rank(identical_matrix, weights, indicator_types)
         ci_scores = result['Ci']
         rankings = result['rankings']
 
-        # All Ci scores should be (very nearly) identical
-        assert np.allclose(ci_scores, ci_scores[0], rtol=1e-10), "Identical alternatives should have identical Ci"
+        # Identical alternatives coincide with both ideal solutions, so TOPSIS
+        # assigns the neutral closeness 0.5 to every one of them
+        np.testing.assert_allclose(ci_scores, 0.5, rtol=1e-10,
+                                   err_msg="Identical alternatives should have identical Ci")
 
         # Rankings should be consecutive integers starting from 1
         sorted_rankings = sorted(rankings)
@@ -147,28 +179,30 @@ class TestTOPSISPropertyBasedValidation:
 
     @given(
         # Generate matrices with specific mathematical properties
-        st.integers(min_value=2, max_value=10).flatmap(lambda n:
-            st.lists(st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-                     min_size=n, max_size=n).map(lambda row: np.array(row))
+        st.integers(min_value=2, max_value=5).flatmap(lambda n:
+            arrays(np.float64, (n, n),
+                   elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
         )
     )
-    def test_monotonicity_property(self, matrix):
+    def test_monotonicity_property(self, _scratch, matrix):
         """Test property: improving an alternative should not worsen its rank."""
         n_alternatives = len(matrix)
         assume(n_alternatives >= 2 and n_alternatives <= 5)
 
         n_criteria = len(matrix)
-        weights = np.ones(n_criteria) / n_criteria
+        weights = _scratch['w'][:n_criteria]
+        weights.fill(1.0 / n_criteria)
         indicator_types = ['benefit'] * n_criteria
 
         # Get baseline rankings
-        baseline_result = topsis_rank(matrix, weights, indicator_types)
+        baseline_result = _cached_topsis_rank(matrix, weights, indicator_types)
 
         # Improve first alternative by setting all criteria to maximum
-        improved_matrix = matrix.copy()
+        improved_matrix = _scratch['imp'][:matrix.shape[0], :matrix.shape[1]]
+        np.copyto(improved_matrix, matrix)
         improved_matrix[0, :] = 1.0  # Best possible values
 
-        improved_result = topsis_rank(improved_matrix, weights, indicator_types)
+        improved_result = _cached_topsis_rank(improved_matrix, weights, indicator_types)
 
         # First alternative should not have worse rank after improvement
         baseline_rank_0 = baseline_result['rankings'][0]
@@ -184,10 +218,8 @@ class TestAHPPropertyBasedValidation:
     @given(
         # Generate consistent comparison matrices
         st.integers(min_value=2, max_value=6).flatmap(lambda n:
-            st.lists(
-                st.floats(min_value=0.1, max_value=9.0, allow_nan=False, allow_infinity=False),
-                min_size=n*n, max_size=n*n
-            ).map(lambda flat_list: np.array(flat_list).reshape(n, n))
+            arrays(np.float64, (n, n),
+                   elements=st.floats(min_value=0.1, max_value=9.0, allow_nan=False, allow_infinity=False))
         )
     )
     def test_ahp_matrix_properties(self, matrix):
@@ -198,23 +230,18 @@ class TestAHPPropertyBasedValidation:
         # Ensure diagonal is 1.0 (comparison matrix property)
         np.fill_diagonal(matrix, 1.0)
 
-        # Ensure reciprocal property
-        for i in range(n):
-            for j in range(n):
-                if matrix[i, j] > 0:
-                    matrix[j, i] = 1.0 / matrix[i, j]
+        # Ensure reciprocal property: lower triangle mirrors the upper one
+        iu = np.triu_indices(n, 1)
+        matrix[iu[1], iu[0]] = 1.0 / matrix[iu[0], iu[1]]
 
         # Test matrix properties
         # Property 1: Diagonal elements should be 1.0
         np.testing.assert_allclose(np.diag(matrix), 1.0, rtol=1e-10,
-                                    "Diagonal elements must be 1.0")
+                                   err_msg="Diagonal elements must be 1.0")
 
         # Property 2: Reciprocal property should hold
-        for i in range(n):
-            for j in range(n):
-                if matrix[i, j] > 0 and matrix[j, i] > 0:
-                    assert abs(matrix[i, j] * matrix[j, i] - 1.0) < 1e-10, \
-                        f"Reciprocal property violated at ({i},{j})"
+        np.testing.assert_allclose(matrix * matrix.T, 1.0, atol=1e-10,
+                                   err_msg="Reciprocal property violated")
 
         # Property 3: All elements should be positive
         assert np.all(matrix > 0), "All matrix elements should be positive"
@@ -224,70 +251,54 @@ class TestAHPPropertyBasedValidation:
     )
     def test_ahp_consistency_bounds(self, n):
         """Test AHP consistency ratio mathematical bounds."""
-        # Generate a matrix with known consistency ratio
-        matrix = np.eye(n)  # Identity matrix - perfectly consistent
+        # Generate a matrix with known consistency ratio: unit diagonal, a small
+        # perturbation (1.1) above it and its reciprocal below it
+        matrix = np.full((n, n), 1.1, dtype=np.float64)
         np.fill_diagonal(matrix, 1.0)
+        matrix[np.tril_indices(n, k=-1)] = 1.0 / 1.1
 
-        # Add small perturbations to create slight inconsistency
-        for i in range(n):
-            for j in range(i+1, n):
-                perturbation = 0.1
-                matrix[i, j] = 1 + perturbation
-                matrix[j, i] = 1 / (1 + perturbation)
-
-        try:
-            weights, cr = calculate_weights(matrix)
+        assume(validate_judgment_matrix(matrix)['is_valid'])
+        result = calculate_weights(matrix)
+        weights, cr = result['weights'], result['CR']
 
-            # Property 1: Weights should be positive
-            assert all(w > 0 for w in weights), "All weights should be positive"
+        # Property 1: Weights should be positive
+        assert np.all(np.asarray(weights) > 0), "All weights should be positive"
 
-            # Property 2: Weights should sum to approximately 1.0
-            weight_sum = sum(weights)
-            assert abs(weight_sum - 1.0) < 1e-6, f"Weights should sum to 1.0, got {weight_sum}"
+        # Property 2: Weights should sum to approximately 1.0
+        weight_sum = np.sum(weights)
+        assert abs(weight_sum - 1.0) < 1e-6, f"Weights should sum to 1.0, got {weight_sum}"
 
-            # Property 3: Consistency ratio should be positive
-            assert cr >= 0, "Consistency ratio should be non-negative"
+        # Property 3: Consistency ratio should be positive
+        assert cr >= 0, "Consistency ratio should be non-negative"
 
-            # Property 4: Consistency ratio should be reasonable (< 1.0 for reasonable matrices)
-            assert cr < 1.0, f"Consistency ratio should be < 1.0, got {cr}"
-
-        except Exception:
-            # Some matrices might be too inconsistent - this is expected
-            pass
+        # Property 4: Consistency ratio should be reasonable (< 1.0 for reasonable matrices)
+        assert cr < 1.0, f"Consistency ratio should be < 1.0, got {cr}"
 
     @given(
         size=st.integers(min_value=2, max_value=6)
     )
     def test_identity_matrix_properties(self, size):
         """Test properties of identity matrices (perfectly consistent)."""
-        identity_matrix = np.eye(size)
-
-        try:
-            weights, cr = calculate_weights(identity_matrix)
+        result = _calc_weights_uniform(size)
+        weights, cr = result['weights'], result['CR']
 
-            # Property 1: Identity matrix should have CR = 0 (perfect consistency)
-            assert abs(cr) < 1e-10, "Identity matrix should have CR = 0"
+        # Property 1: Identity matrix should have CR = 0 (perfect consistency)
+        assert abs(cr) < 1e-10, "Identity matrix should have CR = 0"
 
-            # Property 2: All weights should be equal for identity matrix
-            expected_weight = 1.0 / size
-            for weight in weights:
-                assert abs(weight - expected_weight) < 1e-10, \
-                    f"All weights should be {expected_weight}, got {weight}"
-
-        except Exception:
-            # Handle any unexpected errors gracefully
-            pass
+        # Property 2: All weights should be equal for identity matrix
+        np.testing.assert_allclose(weights, 1.0 / size, atol=1e-10,
+                                   err_msg=f"All weights should be {1.0 / size}")
 
 
 class TestMathematicalInvariants:
     """Test fundamental mathematical invariants across the system."""
 
     @given(
-        arrays=st.lists(
-            st.lists(st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-            min_size=1, max_size=1, min_size=2, max_size=10
-        ).map(np.array)
+        arrays=arrays(np.float64, array_shapes(min_dims=2, max_dims=2, min_side=1, max_side=10),
+                      elements=st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False))
     )
+    # Single-row input whose values allclose() treats as equal but argmax does not
+    @example(arrays=np.array([[0.0, 8.3e-250]]))
     def test_array_indexing_invariants(self, arrays):
         """Test fundamental array indexing invariants."""
         arr = arrays.flatten()
@@ -302,13 +313,14 @@ class TestMathematicalInvariants:
         assert 0 <= min_idx < n, f"argmin index {min_idx} should be in [0, {n-1}]"
 
         # Property 2: argmax should point to maximum value
-        assert arr[max_idx] >= arr[i] for i in range(n), "argmax should point to maximum value"
+        assert np.all(arr[max_idx] >= arr), "argmax should point to maximum value"
 
         # Property 3: argmin should point to minimum value
-        assert arr[min_idx] <= arr[i] for i in range(n), "argmin should point to minimum value"
+        assert np.all(arr[min_idx] <= arr), "argmin should point to minimum value"
 
         # Property 4: For identical values, argmax should return first occurrence
-        if np.allclose(arr, arr[0]):
+        # (exact equality: argmax tells apart values allclose() treats as equal)
+        if np.all(arr == arr[0]):
             assert max_idx == 0, "For identical values, argmax should return 0"
 
     @given(
@@ -316,59 +328,54 @@ class TestMathematicalInvariants:
     )
     def test_ranking_invariants(self, sequences):
         """Test fundamental ranking invariants."""
-        # Create rankings from sequence (lower = better rank)
-        ranks = np.array([len(sequences) - np.argsort(sequences).argsort()])
-
         n = len(sequences)
 
+        # Create rankings from sequence (largest value gets rank 1) with one sort
+        order = np.argsort(np.asarray(sequences), kind='stable')
+        ranks = np.empty(n, dtype=np.int64)
+        ranks[order] = np.arange(n, 0, -1)
+
         # Property 1: Rankings should be a permutation of 1..n
         expected_rankings = set(range(1, n + 1))
         actual_rankings = set(ranks)
         assert actual_rankings == expected_rankings, "Rankings must be complete permutation"
 
         # Property 2: Each rank should appear exactly once
-        rank_counts = {}
-        for rank in ranks:
-            rank_counts[rank] = rank_counts.get(rank, 0) + 1
-
-        for rank in expected_rankings:
-            assert rank_counts[rank] == 1, f"Rank {rank} should appear exactly once"
+        counts = np.bincount(ranks, minlength=n + 1)
+        assert np.all(counts[1:n + 1] == 1), "Each rank should appear exactly once"
 
         # Property 3: Best rank (1) should be unique
-        rank_one_count = sum(1 for r in ranks if r == 1)
+        rank_one_count = int((ranks == 1).sum())
         assert rank_one_count == 1, "Rank 1 should be unique"
 
     @given(
-        arrays=st.lists(
-            st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=20
-        ).map(np.array)
+        arrays=arrays(np.float64, st.integers(min_value=2, max_value=20),
+                      elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
     )
     def test_normalization_invariants(self, arrays):
         """Test mathematical invariants of normalization."""
         n = len(arrays)
         assume(n > 0)
+        total = np.sum(arrays)
+        assume(total > 0)  # All-zero input has no sum-to-1 normalization
 
         # Test sum-to-1 normalization
-        normalized = arrays / np.sum(arrays)
+        normalized = arrays / total
 
         # Property 1: Sum should be 1.0
         assert abs(np.sum(normalized) - 1.0) < 1e-12, "Normalized array should sum to 1.0"
 
         # Property 2: All elements should be in [0, 1]
-        assert all(0.0 <= x <= 1.0 for x in normalized), "Normalized elements should be in [0,1]"
+        assert np.all((normalized >= 0.0) & (normalized <= 1.0)), "Normalized elements should be in [0,1]"
 
-        # Property 3: Order should be preserved
-        original_order = np.argsort(arrays)
-        normalized_order = np.argsort(normalized)
-        np.testing.assert_array_equal(original_order, normalized_order,
-                                    "Normalization should preserve order")
+        # Property 3: Order should be preserved, i.e. normalization is a positive
+        # scaling (atol absorbs precision lost to subnormal results)
+        np.testing.assert_allclose(normalized * total, arrays, rtol=1e-12, atol=1e-300,
+                                   err_msg="Normalization should be a positive scaling")
 
     @given(
-        matrices=st.lists(
-            st.lists(st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=2, min_size=2, max_size=5
-        ).map(np.array)
+        matrices=arrays(np.float64, array_shapes(min_dims=2, max_dims=2, min_side=2, max_side=5),
+                        elements=st.floats(min_value=0.0, max_value=1.0, allow_nan=False, allow_infinity=False))
     )
     def test_matrix_shape_invariants(self, matrices):
         """Test matrix mathematical invariants."""
@@ -383,8 +390,8 @@ class TestMathematicalInvariants:
         row_sums = np.sum(matrices, axis=1)
         col_sums = np.sum(matrices, axis=0)
 
-        assert all(rs >= 0 for rs in row_sums), "Row sums should be non-negative"
-        assert all(cs >= 0 for cs in col_sums), "Column sums should be non-negative"
+        assert np.all(row_sums >= 0), "Row sums should be non-negative"
+        assert np.all(col_sums >= 0), "Column sums should be non-negative"
 
         # Property 3: Double transpose should return original
         double_transposed = matrices.T.T
@@ -405,20 +412,15 @@ class TestEdgeCaseGeneration:
         weights = np.array([0.5, 0.5])
         types = ['benefit', 'benefit']
 
-        try:
-            result = topsis_rank(matrix, weights, types)
+        result = topsis_rank(matrix, weights, types)
 
-            # Should not produce NaN or Inf
-            assert not np.any(np.isnan(result['Ci'])), "Tiny values should not produce NaN"
-            assert not np.any(np.isinf(result['Ci'])), "Tiny values should not produce Inf"
-
-            # Rankings should still be valid
-            n = len(result['rankings'])
-            assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
+        # Should not produce NaN or Inf
+        assert not np.any(np.isnan(result['Ci'])), "Tiny values should not produce NaN"
+        assert not np.any(np.isinf(result['Ci'])), "Tiny values should not produce Inf"
 
-        except Exception:
-            # Some edge cases might fail - this is acceptable
-            pass
+        # Rankings should still be valid
+        n = len(result['rankings'])
+        assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
 
     @given(
         st.floats(min_value=1e6, max_value=1e10, allow_nan=False, allow_infinity=False)
@@ -430,53 +432,43 @@ class TestEdgeCaseGeneration:
         weights = np.array([0.5, 0.5])
         types = ['benefit', 'benefit']
 
-        try:
-            result = topsis_rank(matrix, weights, types)
+        result = topsis_rank(matrix, weights, types)
 
-            # Should not produce NaN or Inf
-            assert not np.any(np.isnan(result['Ci'])), "Large values should not produce NaN"
-            assert not np.any(np.isinf(result['Ci'])), "Large values should not produce Inf"
-
-            # Rankings should still be valid
-            n = len(result['rankings'])
-            assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
+        # Should not produce NaN or Inf
+        assert not np.any(np.isnan(result['Ci'])), "Large values should not produce NaN"
+        assert not np.any(np.isinf(result['Ci'])), "Large values should not produce Inf"
 
-        except Exception:
-            # Some edge cases might fail - this is acceptable
-            pass
+        # Rankings should still be valid
+        n = len(result['rankings'])
+        assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
 
     @given(
-        size=st.integers(min_value=2, max_size=10)
+        size=st.integers(min_value=2, max_value=10),
+        seed=st.integers(min_value=0, max_value=2**32 - 1)
     )
-    def test_near_singular_matrices(self, size):
+    def test_near_singular_matrices(self, size, seed):
         """Test with matrices that are nearly singular."""
-        # Create a nearly singular matrix
-        matrix = np.random.rand(size, size)
+        # Create a nearly singular matrix; the generator is seeded from the
+        # example so replaying or shrinking it draws the same matrix
+        rng = np.random.default_rng(seed)
+        matrix = rng.random((size, size))
 
         # Make one row nearly equal to another
-        matrix[1] = matrix[0] + np.random.normal(0, 1e-10, size)
+        matrix[1] = matrix[0] + rng.normal(0, 1e-10, size)
 
         weights = np.ones(size) / size
         types = ['benefit'] * size
 
-        try:
-            result = topsis_rank(matrix, weights, types)
-
-            # Should handle gracefully
-            assert len(result['Ci']) == size, "Should produce correct number of Ci scores"
-            assert len(result['rankings']) == size, "Should produce correct number of rankings"
+        # The perturbation can push an entry just below zero, which TOPSIS rejects
+        assume(np.all(matrix >= 0))
+        result = topsis_rank(matrix, weights, types)
 
-        except Exception:
-            # Some singular matrices might fail - this is acceptable
-            pass
+        # Should handle gracefully
+        assert len(result['Ci']) == size, "Should produce correct number of Ci scores"
+        assert len(result['rankings']) == size, "Should produce correct number of rankings"
 
 
-# Test configuration for Hypothesis
-def pytest_configure(config):
-    """Configure Hypothesis settings for property-based testing."""
-    # Increase number of examples for thorough testing
-    settings.register_profile("ci", max_examples=1000)
-    settings.register_profile("dev", max_examples=100)
+# Hypothesis profiles ("ci", "dev") are registered in tests/conftest.py
 
 # Mark all tests as mathematical validation
-pytest_plugins = [pytest.mark.mathematical]
\ No newline at end of file
+pytestmark = pytest.mark.mathematical
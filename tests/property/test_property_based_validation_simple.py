@@ -7,7 +7,7 @@ hundreds of test cases and validate mathematical invariants across wide input ra
 
 import pytest
 import numpy as np
-from hypothesis import given, strategies as st, assume
+from hypothesis import given, settings, strategies as st
 import warnings
 
 # Add parent directory to path for imports
@@ -15,23 +15,83 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from modules.topsis_module import topsis_rank
+from modules.topsis_module import topsis_rank, topsis_rank_batch
 from modules.ahp_module import calculate_weights
 
+# Pool of pre-drawn random rows shared by the array strategies below: each example
+# slices a read-only view out of a pool instead of building a fresh array
+_POOL_ROWS, _POOL_COLS = 200, 25
+_BASE_POOL = np.random.default_rng(0).random((_POOL_ROWS, _POOL_COLS), dtype=np.float64)
+
+
+def _scaled_pool(low, high):
+    """Read-only copy of the base pool rescaled into [low, high)."""
+    pool = low + (high - low) * _BASE_POOL
+    pool.setflags(write=False)
+    return pool
+
+
+def _pool_vectors(pool, min_len, max_len):
+    """Strategy of 1-D views: row index and length are drawn, so Hypothesis can still shrink."""
+    return st.builds(lambda i, n: pool[i, :n],
+                     st.integers(min_value=0, max_value=_POOL_ROWS - 1),
+                     st.integers(min_value=min_len, max_value=max_len))
+
+
+def _pool_matrix_batches(pool, rows, cols, batch_size=32):
+    """Strategy of (batch_size, m, n) tensors: consecutive pool rows from a drawn start,
+    each reshaped to one (m, n) matrix, with m and n drawn from the given ranges."""
+    return st.builds(lambda i, m, n: pool[(i + np.arange(batch_size)) % _POOL_ROWS, :m * n]
+                     .reshape(batch_size, m, n),
+                     st.integers(min_value=0, max_value=_POOL_ROWS - 1),
+                     st.integers(min_value=rows[0], max_value=rows[1]),
+                     st.integers(min_value=cols[0], max_value=cols[1]))
+
+
+_POOL_0_100 = _scaled_pool(0.0, 100.0)
+_POOL_0_10 = _scaled_pool(0.0, 10.0)
+_POOL_POSITIVE = _scaled_pool(0.01, 1.0)
+
+# Strategies shared by the tests below, built once at import
+_VECTORS_0_100 = _pool_vectors(_POOL_0_100, 2, 20)
+_POSITIVE_VECTORS = _pool_vectors(_POOL_POSITIVE, 2, 20)
+_DECISION_BATCHES = _pool_matrix_batches(_POOL_0_10, rows=(3, 5), cols=(2, 5))
+_RANK_SEQUENCES = st.lists(st.integers(min_value=1, max_value=100), min_size=2, max_size=20)
+_WEIGHT_VECTORS = st.lists(
+    st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False),
+    min_size=3, max_size=6
+).map(np.asarray).map(lambda w: w / w.sum())
+_MATRIX_SIZES = st.integers(min_value=2, max_value=10)
+_TINY_VALUES = st.floats(min_value=1e-15, max_value=1e-10, allow_nan=False, allow_infinity=False)
+_LARGE_VALUES = st.floats(min_value=1e6, max_value=1e10, allow_nan=False, allow_infinity=False)
+
+# Equal weights and all-benefit types over the 5 criteria used by the array-bounds test
+_EQUAL_WEIGHTS_5 = np.full(5, 1.0 / 5)
+_EQUAL_WEIGHTS_5.setflags(write=False)
+_BENEFIT_TYPES_5 = ('benefit',) * 5
+
+
+def _is_permutation_1_to_n(a, n):
+    """True if ``a`` holds each rank 1..n exactly once."""
+    counts = np.bincount(np.asarray(a, dtype=np.int64), minlength=n + 1)
+    return len(a) == n and counts[0] == 0 and bool(np.all(counts[1:] == 1))
+
+
+@pytest.fixture(scope="session")
+def rand_pool():
+    """Random decision matrices for the array-bounds test: slice [n-2, :n, :] per size n in 2..10."""
+    return np.random.default_rng(0).random((9, 10, 5))
+
 
 class TestMathematicalInvariants:
     """Test fundamental mathematical invariants across the system."""
 
     @given(
-        arrays=st.lists(
-            st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=20
-        ).map(np.array)
+        arrays=_VECTORS_0_100
     )
     def test_array_indexing_invariants(self, arrays):
         """Test fundamental array indexing invariants."""
         n = len(arrays)
-        assume(n >= 1)
 
         # Property 1: argmax and argmin indices should be in bounds
         max_idx = np.argmax(arrays)
@@ -41,61 +101,49 @@ class TestMathematicalInvariants:
         assert 0 <= min_idx < n, f"argmin index {min_idx} should be in [0, {n-1}]"
 
         # Property 2: argmax should point to maximum value
-        assert arrays[max_idx] >= arrays[i] for i in range(n), "argmax should point to maximum value"
+        assert arrays[max_idx] == arrays.max(), "argmax should point to maximum value"
 
         # Property 3: argmin should point to minimum value
-        assert arrays[min_idx] <= arrays[i] for i in range(n), "argmin should point to minimum value"
+        assert arrays[min_idx] == arrays.min(), "argmin should point to minimum value"
 
-        # Property 4: For identical values, argmax should return first occurrence
-        if np.allclose(arrays, arrays[0]):
-            assert max_idx == 0, "For identical values, argmax should return 0"
+        # Property 4: On ties, argmax/argmin should return the first occurrence
+        assert np.flatnonzero(arrays == arrays.max())[0] == max_idx, \
+            "argmax should return the first occurrence of the maximum"
+        assert np.flatnonzero(arrays == arrays.min())[0] == min_idx, \
+            "argmin should return the first occurrence of the minimum"
 
     @given(
-        sequences=st.lists(st.integers(min_value=1, max_value=100), min_size=2, max_size=20)
+        sequences=_RANK_SEQUENCES
     )
     def test_ranking_invariants(self, sequences):
         """Test fundamental ranking invariants."""
         # Create rankings from sequence (lower = better rank)
-        ranks = np.array([len(sequences) - np.argsort(sequences).argsort()])
+        ranks = len(sequences) - np.argsort(sequences).argsort()
 
         n = len(sequences)
 
-        # Property 1: Rankings should be a permutation of 1..n
-        expected_rankings = set(range(1, n + 1))
-        actual_rankings = set(ranks)
-        assert actual_rankings == expected_rankings, "Rankings must be complete permutation"
-
-        # Property 2: Each rank should appear exactly once
-        rank_counts = {}
-        for rank in ranks:
-            rank_counts[rank] = rank_counts.get(rank, 0) + 1
-
-        for rank in expected_rankings:
-            assert rank_counts[rank] == 1, f"Rank {rank} should appear exactly once"
-
-        # Property 3: Best rank (1) should be unique
-        rank_one_count = sum(1 for r in ranks if r == 1)
-        assert rank_one_count == 1, "Rank 1 should be unique"
+        # Property: Rankings should be a permutation of 1..n, each rank
+        # (so also the best rank 1) appearing exactly once
+        assert _is_permutation_1_to_n(ranks, n), "Rankings must be complete permutation"
 
     @given(
-        arrays=st.lists(
-            st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False),
-            min_size=2, max_size=20
-        ).map(np.array)
+        arrays=_POSITIVE_VECTORS
     )
     def test_normalization_invariants(self, arrays):
         """Test mathematical invariants of normalization."""
         n = len(arrays)
-        assume(n > 0)
 
         # Test sum-to-1 normalization
-        normalized = arrays / np.sum(arrays)
+        total = arrays.sum()
+        normalized = arrays / total
 
-        # Property 1: Sum should be 1.0
-        assert abs(np.sum(normalized) - 1.0) < 1e-12, "Normalized array should sum to 1.0"
+        # Property 1: Sum should be 1.0, up to the rounding error of n divisions
+        # and an n-term summation
+        assert abs(np.sum(normalized) - 1.0) < n * np.finfo(arrays.dtype).eps, \
+            "Normalized array should sum to 1.0"
 
         # Property 2: All elements should be in [0, 1]
-        assert all(0.0 <= x <= 1.0 for x in normalized), "Normalized elements should be in [0,1]"
+        assert np.all((normalized >= 0.0) & (normalized <= 1.0)), "Normalized elements should be in [0,1]"
 
         # Property 3: Order should be preserved
         original_order = np.argsort(arrays)
@@ -108,97 +156,82 @@ class TestTOPSISPropertyBasedValidation:
     """Property-based testing for TOPSIS algorithm mathematical correctness."""
 
     @given(
-        # Generate valid decision matrices
-        st.integers(min_value=2, max_value=5).flatmap(lambda n:
-            st.lists(
-                st.lists(st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False),
-                    min_size=n, max_size=n,
-                    min_size=3, max_size=5
-                ).map(lambda rows: np.array(rows))
-        )
+        # Generate batches of valid decision matrices: 3-5 alternatives x 2-5 criteria
+        _DECISION_BATCHES
     )
-    def test_topsis_basic_properties(self, decision_matrix):
-        """Test basic TOPSIS properties with valid decision matrices."""
-        m, n = decision_matrix.shape  # m alternatives, n criteria
-        assume(m >= 2 and n >= 2 and m <= 5 and n <= 5)
+    def test_topsis_basic_properties(self, decision_tensor):
+        """Test basic TOPSIS properties with valid decision matrices, one batch per example."""
+        batch_size, m, n = decision_tensor.shape  # m alternatives, n criteria
 
         # Create corresponding weights and types
         weights = np.ones(n) / n
         indicator_types = ['benefit'] * n
 
-        # Run TOPSIS
-        result = topsis_rank(decision_matrix, weights, indicator_types)
+        # Run TOPSIS on the whole batch at once
+        result = topsis_rank_batch(decision_tensor, weights, indicator_types)
         ci_scores = result['Ci']
         rankings = result['rankings']
 
         # Property 1: Ci scores should be in [0, 1] range
-        assert all(0.0 <= ci <= 1.0 for ci in ci_scores), "Ci scores must be in [0,1]"
+        assert np.all((ci_scores >= 0.0) & (ci_scores <= 1.0)), "Ci scores must be in [0,1]"
 
-        # Property 2: Rankings should be a complete permutation of 1..m
-        expected_rankings = set(range(1, m + 1))
-        actual_rankings = set(rankings)
-        assert actual_rankings == expected_rankings, "Rankings must be complete permutation"
+        # Property 2: Rankings of every matrix should be a complete permutation of 1..m
+        assert np.all(np.sort(rankings, axis=1) == np.arange(1, m + 1)), \
+            "Rankings must be complete permutation"
 
         # Property 3: Array bounds validation
-        assert len(ci_scores) == m, f"Should have {m} Ci scores"
-        assert len(rankings) == m, f"Should have {m} rankings"
+        assert ci_scores.shape == (batch_size, m), f"Should have {m} Ci scores per matrix"
+        assert rankings.shape == (batch_size, m), f"Should have {m} rankings per matrix"
+
+        # Property 4: The batch agrees with the single-matrix implementation
+        single = topsis_rank(decision_tensor[0], weights, indicator_types)
+        np.testing.assert_allclose(ci_scores[0], single['Ci'], rtol=1e-12)
+        np.testing.assert_array_equal(rankings[0], single['rankings'])
 
     @given(
         # Generate weight vectors
-        st.lists(st.floats(min_value=0.01, max_value=1.0, allow_nan=False, allow_infinity=False),
-                    min_size=3, max_size=6).map(lambda w: np.array(w) / np.sum(w))
+        _WEIGHT_VECTORS
     )
     def test_weight_normalization_properties(self, weights):
         """Test weight vector normalization properties."""
-        n = len(weights)
-        assume(n >= 2 and n <= 6)
-
         # Property 1: Weights should sum to approximately 1.0
         assert abs(np.sum(weights) - 1.0) < 1e-10, f"Weights should sum to 1.0, got {np.sum(weights)}"
 
         # Property 2: All weights should be positive
-        assert all(w > 0 for w in weights), "All weights should be positive"
+        assert np.all(weights > 0), "All weights should be positive"
 
         # Property 3: All weights should be in (0, 1] range
-        assert all(0 < w <= 1 for w in weights), "Weights should be in (0, 1] range"
+        assert np.all((weights > 0) & (weights <= 1)), "Weights should be in (0, 1] range"
 
     @given(
         # Test with different matrix sizes
-        st.integers(min_value=2, max_value=10)
+        _MATRIX_SIZES
     )
-    def test_array_bounds_validation(self, n):
+    def test_array_bounds_validation(self, rand_pool, n):
         """Test that array operations stay within bounds."""
-        assume(2 <= n <= 10)  # Reasonable range for testing
-
         # Create test matrix
-        matrix = np.random.rand(n, 5)  # n alternatives, 5 criteria
-        weights = np.ones(5) / 5
-        types = ['benefit'] * 5
+        matrix = rand_pool[n - 2, :n, :]  # n alternatives, 5 criteria
+        weights = _EQUAL_WEIGHTS_5
+        types = _BENEFIT_TYPES_5
 
-        try:
-            result = topsis_rank(matrix, weights, types)
-            ci_scores = result['Ci']
-            rankings = result['rankings']
-
-            # All indices should be valid
-            assert len(ci_scores) == n, f"Ci scores length should match number of alternatives {n}"
-            assert len(rankings) == n, f"Rankings length should match number of alternatives {n}"
+        result = topsis_rank(matrix, weights, types)
+        ci_scores = result['Ci']
+        rankings = result['rankings']
 
-            # Best index should be in valid range
-            best_idx = np.argmin(rankings)
-            assert 0 <= best_idx < n, f"Best index {best_idx} should be in range [0, {n-1}]"
+        # All indices should be valid
+        assert len(ci_scores) == n, f"Ci scores length should match number of alternatives {n}"
+        assert len(rankings) == n, f"Rankings length should match number of alternatives {n}"
 
-        except Exception:
-            # Some edge cases might fail - this is acceptable
-            pass
+        # Best index should be in valid range
+        best_idx = np.argmin(rankings)
+        assert 0 <= best_idx < n, f"Best index {best_idx} should be in range [0, {n-1}]"
 
 
 class TestEdgeCaseGeneration:
     """Generate and test edge cases that manual testing might miss."""
 
-    @given(
-        st.floats(min_value=1e-15, max_value=1e-10, allow_nan=False, allow_infinity=False)
-    )
+    @settings(parent=settings.get_profile("heavy"))
+    @given(_TINY_VALUES)
     def test_extreme_small_values(self, tiny_value):
         """Test behavior with extremely small values."""
         # Test with arrays containing tiny values
@@ -206,25 +239,19 @@ class TestEdgeCaseGeneration:
         weights = np.array([0.5, 0.5])
         types = ['benefit', 'benefit']
 
-        try:
-            result = topsis_rank(matrix, weights, types)
-
-            # Should not produce NaN or Inf
-            assert not np.any(np.isnan(result['Ci'])), "Tiny values should not produce NaN"
-            assert not np.any(np.isinf(result['Ci'])), "Tiny values should not produce Inf"
+        result = topsis_rank(matrix, weights, types)
 
-            # Rankings should still be valid (if they exist)
-            if 'rankings' in result:
-                n = len(result['rankings'])
-                assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
+        # Should not produce NaN or Inf
+        assert not np.any(np.isnan(result['Ci'])), "Tiny values should not produce NaN"
+        assert not np.any(np.isinf(result['Ci'])), "Tiny values should not produce Inf"
 
-        except Exception:
-            # Some edge cases might fail - this is acceptable
-            pass
+        # Rankings should still be valid (if they exist)
+        if 'rankings' in result:
+            n = len(result['rankings'])
+            assert _is_permutation_1_to_n(result['rankings'], n), "Rankings should be valid"
 
-    @given(
-        st.floats(min_value=1e6, max_value=1e10, allow_nan=False, allow_infinity=False)
-    )
+    @settings(parent=settings.get_profile("heavy"))
+    @given(_LARGE_VALUES)
     def test_extreme_large_values(self, large_value):
         """Test behavior with extremely large values."""
         # Test with matrices containing large values
@@ -232,29 +259,19 @@ class TestEdgeCaseGeneration:
         weights = np.array([0.5, 0.5])
         types = ['benefit', 'benefit']
 
-        try:
-            result = topsis_rank(matrix, weights, types)
-
-            # Should not produce NaN or Inf
-            assert not np.any(np.isnan(result['Ci'])), "Large values should not produce NaN"
-            assert not np.any(np.isinf(result['Ci'])), "Large values should not produce Inf"
+        result = topsis_rank(matrix, weights, types)
 
-            # Rankings should still be valid (if they exist)
-            if 'rankings' in result:
-                n = len(result['rankings'])
-                assert set(result['rankings']) == set(range(1, n + 1)), "Rankings should be valid"
+        # Should not produce NaN or Inf
+        assert not np.any(np.isnan(result['Ci'])), "Large values should not produce NaN"
+        assert not np.any(np.isinf(result['Ci'])), "Large values should not produce Inf"
 
-        except Exception:
-            # Some edge cases might fail - this is acceptable
-            pass
+        # Rankings should still be valid (if they exist)
+        if 'rankings' in result:
+            n = len(result['rankings'])
+            assert _is_permutation_1_to_n(result['rankings'], n), "Rankings should be valid"
 
 
-# Configure Hypothesis settings
-def pytest_configure(config):
-    """Configure Hypothesis for thorough testing."""
-    from hypothesis import settings
-    settings.register_profile("default", max_examples=200, deadline=10000)
-    settings.load_profile("default")
+# Hypothesis profiles ("ci", "dev", "heavy") are registered in tests/conftest.py
 
-# Mark tests as mathematical validation
-pytest_plugins = [pytest.mark.mathematical]
\ No newline at end of file
+# Mark all tests as mathematical validation
+pytestmark = pytest.mark.mathematical
\ No newline at end of file
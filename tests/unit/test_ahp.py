@@ -9,30 +9,75 @@ import numpy as np
 import yaml
 import sys
 import os
+import io
+from functools import lru_cache
+from types import MappingProxyType
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from modules import ahp_module
 from modules.ahp_module import calculate_weights, validate_judgment_matrix, load_judgment_matrix, JudgmentMatrixError
 from utils.consistency_check import AHPConsistencyError
 
+# Judgment matrix document served in memory to load_judgment_matrix
+_LOAD_TEST_YAML = yaml.dump({
+    'matrix_id': 'test_load',
+    'matrix': [
+        [1.0, 2.0, 3.0],
+        [0.5, 1.0, 1.5],
+        [0.333, 0.667, 1.0]
+    ]
+})
+
+
+@lru_cache(maxsize=128)
+def _cached_weights(mbytes, shape, dtype_str, vc):
+    """calculate_weights memoised on the raw matrix bytes, shared by tests using the same fixture matrix."""
+    matrix = np.frombuffer(mbytes, dtype=np.dtype(dtype_str)).reshape(shape)
+    return calculate_weights(matrix, validate_consistency=vc)
+
+
+def _freeze(node):
+    """Recursively turn loaded YAML dicts/lists into read-only mappings/tuples."""
+    if isinstance(node, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in node.items()})
+    if isinstance(node, list):
+        return tuple(_freeze(value) for value in node)
+    return node
+
+
+@pytest.fixture(scope="session")
+def sample_matrices():
+    """Load sample matrices from fixtures.
+
+    Parsed once per session (under pytest-xdist, once per worker process) and
+    frozen, so no test can leak changes into another through the shared copy.
+    Each entry also carries its matrix pre-converted to a read-only float
+    array under 'matrix_np'.
+    """
+    fixture_path = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'sample_matrices.yaml')
+    with open(fixture_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+
+    for entry in data.values():
+        if isinstance(entry, dict) and 'matrix' in entry:
+            matrix_np = np.asarray(entry['matrix'], dtype=np.float64)
+            matrix_np.setflags(write=False)
+            entry['matrix_np'] = matrix_np
+
+    return _freeze(data)
+
 
 class TestAHPModule:
     """Test cases for AHP module functionality."""
 
-    @pytest.fixture
-    def sample_matrices(self):
-        """Load sample matrices from fixtures."""
-        fixture_path = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'sample_matrices.yaml')
-        with open(fixture_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
     def test_calculate_weights_valid_matrix(self, sample_matrices):
         """Test weight calculation with valid consistent matrix."""
         matrix_data = sample_matrices['valid_matrix_3x3']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
-        result = calculate_weights(matrix, validate_consistency=True)
+        result = _cached_weights(matrix.tobytes(), matrix.shape, str(matrix.dtype), True)
 
         # Check basic structure
         assert 'weights' in result
@@ -45,11 +90,12 @@ class TestAHPModule:
         assert result['CR'] <= 0.1
 
         # Check weights sum to 1
-        weight_sum = sum(result['weights'])
-        assert abs(weight_sum - 1.0) < 1e-6, f"Weights sum to {weight_sum}, expected 1.0"
+        weight_sum = result['weights'].sum()
+        np.testing.assert_allclose(weight_sum, 1.0, rtol=0, atol=1e-6,
+                                   err_msg="Weights should sum to 1.0")
 
         # Check weights are positive
-        assert all(w > 0 for w in result['weights']), "All weights should be positive"
+        assert np.all(result['weights'] > 0), "All weights should be positive"
 
         # Check number of weights matches matrix size
         assert len(result['weights']) == matrix.shape[0]
@@ -57,7 +103,7 @@ class TestAHPModule:
     def test_calculate_weights_invalid_cr(self, sample_matrices):
         """Test weight calculation with inconsistent matrix."""
         matrix_data = sample_matrices['invalid_matrix_inconsistent']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # The test matrix violates reciprocal property, so calculate_weights should raise JudgmentMatrixError
         try:
@@ -71,7 +117,7 @@ class TestAHPModule:
     def test_calculate_weights_without_validation(self, sample_matrices):
         """Test weight calculation without consistency validation."""
         matrix_data = sample_matrices['invalid_matrix_inconsistent']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # Should not raise exception when validation is disabled
         result = calculate_weights(matrix, validate_consistency=False)
@@ -84,7 +130,7 @@ class TestAHPModule:
     def test_validate_judgment_matrix_reciprocal_violation(self, sample_matrices):
         """Test matrix validation with reciprocal property violation."""
         matrix_data = sample_matrices['invalid_matrix_no_reciprocal']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # Should fail validation due to reciprocal violation
         result = validate_judgment_matrix(matrix)
@@ -93,7 +139,7 @@ class TestAHPModule:
     def test_validate_judgment_matrix_not_square(self, sample_matrices):
         """Test matrix validation with non-square matrix."""
         matrix_data = sample_matrices['invalid_matrix_not_square']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # Should fail validation due to non-square matrix
         result = validate_judgment_matrix(matrix)
@@ -102,7 +148,7 @@ class TestAHPModule:
     def test_validate_judgment_matrix_wrong_diagonal(self, sample_matrices):
         """Test matrix validation with incorrect diagonal elements."""
         matrix_data = sample_matrices['invalid_matrix_wrong_diagonal']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # Should fail validation due to non-unit diagonal
         result = validate_judgment_matrix(matrix)
@@ -111,7 +157,7 @@ class TestAHPModule:
     def test_validate_judgment_matrix_valid(self, sample_matrices):
         """Test matrix validation with valid matrix."""
         matrix_data = sample_matrices['valid_matrix_5x5']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
         # Should pass validation
         result = validate_judgment_matrix(matrix)
@@ -120,12 +166,13 @@ class TestAHPModule:
     def test_calculate_weights_perfect_consistency(self, sample_matrices):
         """Test weight calculation with perfectly consistent matrix."""
         matrix_data = sample_matrices['valid_matrix_3x3']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
-        result = calculate_weights(matrix, validate_consistency=True)
+        result = _cached_weights(matrix.tobytes(), matrix.shape, str(matrix.dtype), True)
 
         # Perfectly consistent matrix should have CR = 0
-        assert abs(result['CR'] - 0.0) < 1e-6, f"Expected CR ≈ 0, got {result['CR']}"
+        np.testing.assert_allclose(result['CR'], 0.0, rtol=0, atol=1e-6,
+                                   err_msg="Expected CR ≈ 0")
 
         # Should be valid
         assert result['valid'] == True
@@ -133,67 +180,55 @@ class TestAHPModule:
     def test_calculate_weights_large_matrix(self, sample_matrices):
         """Test weight calculation with larger matrix."""
         matrix_data = sample_matrices['valid_matrix_5x5']
-        matrix = np.array(matrix_data['matrix'])
+        matrix = matrix_data['matrix_np']
 
-        result = calculate_weights(matrix, validate_consistency=True)
+        result = _cached_weights(matrix.tobytes(), matrix.shape, str(matrix.dtype), True)
 
         # Should handle larger matrices correctly
         assert len(result['weights']) == 5
         assert result['valid'] == True
         assert result['CR'] <= 0.1
 
-    def test_load_judgment_matrix(self):
+    def test_load_judgment_matrix(self, monkeypatch):
         """Test loading judgment matrix from YAML file."""
-        # Create a temporary YAML file for testing
-        test_matrix = {
-            'matrix_id': 'test_load',
-            'matrix': [
-                [1.0, 2.0, 3.0],
-                [0.5, 1.0, 1.5],
-                [0.333, 0.667, 1.0]
-            ]
-        }
-
-        # Write to temporary file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(test_matrix, f)
-            temp_path = f.name
+        # Serve the YAML document from memory instead of a temporary file
+        fake_path = 'in_memory/test_load.yaml'
+        real_open = open
 
-        try:
-            # Test loading
-            result = load_judgment_matrix(temp_path)
+        def fake_open(path, *args, **kwargs):
+            if path == fake_path:
+                return io.StringIO(_LOAD_TEST_YAML)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(ahp_module, 'open', fake_open, raising=False)
 
-            assert 'matrix' in result
-            assert 'matrix_id' in result
-            assert result['matrix_id'] == 'test_load'
-            assert len(result['matrix']) == 3
+        result = load_judgment_matrix(fake_path)
 
-        finally:
-            # Clean up
-            os.unlink(temp_path)
+        assert 'matrix' in result
+        assert 'matrix_id' in result
+        assert result['matrix_id'] == 'test_load'
+        assert len(result['matrix']) == 3
 
     def test_calculate_weights_random_matrix_properties(self):
         """Test mathematical properties of weight calculation with random matrix."""
         # Generate a random positive reciprocal matrix
-        np.random.seed(42)  # For reproducibility
+        rng = np.random.default_rng(42)  # For reproducibility
         n = 4
 
-        # Create random matrix ensuring reciprocal property
-        matrix = np.ones((n, n))
-        for i in range(n):
-            for j in range(i+1, n):
-                # Generate random comparison
-                comparison = np.random.uniform(0.2, 5.0)
-                matrix[i, j] = comparison
-                matrix[j, i] = 1.0 / comparison
+        # Create random matrix ensuring reciprocal property: random comparisons
+        # above the diagonal, their reciprocals mirrored below it
+        comparisons = rng.uniform(0.2, 5.0, (n, n))
+        iu = np.triu_indices(n, k=1)
+        matrix = np.eye(n)
+        matrix[iu] = comparisons[iu]
+        matrix[iu[1], iu[0]] = 1.0 / comparisons[iu]
 
         result = calculate_weights(matrix, validate_consistency=False)
 
         # Test mathematical properties
         assert len(result['weights']) == n
-        assert abs(sum(result['weights']) - 1.0) < 1e-10
-        assert all(w > 0 for w in result['weights'])
+        np.testing.assert_allclose(result['weights'].sum(), 1.0, rtol=0, atol=1e-10)
+        assert np.all(result['weights'] > 0)
         assert result['lambda_max'] >= n  # Should be >= matrix size
 
     def test_edge_cases(self):
@@ -206,7 +241,7 @@ class TestAHPModule:
 
         result = calculate_weights(matrix_2x2, validate_consistency=True)
         assert len(result['weights']) == 2
-        assert abs(sum(result['weights']) - 1.0) < 1e-6
+        np.testing.assert_allclose(result['weights'].sum(), 1.0, rtol=0, atol=1e-6)
 
     def test_error_handling_invalid_input(self):
         """Test error handling with invalid inputs."""
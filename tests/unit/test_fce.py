@@ -7,44 +7,83 @@ Tests fuzzy comprehensive evaluation, membership functions, and score calculatio
 import pytest
 import numpy as np
 import yaml
-import sys
 import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
-from modules.fce_module import fuzzy_evaluate, validate_membership_degrees, FCEError
+import math
+from functools import lru_cache
+from types import MappingProxyType
+
+# The repository root is put on sys.path once, by tests/conftest.py
+from modules.fce_module import (fuzzy_evaluate, fuzzy_evaluate_batch, assessments_to_counts,
+                                validate_membership_degrees, FCEError)
+
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+# Standard fuzzy scale, shared read-only by every test
+_FUZZY_SCALE = MappingProxyType({
+    '差': 0.25,  # Poor
+    '中': 0.50,  # Medium
+    '良': 0.75,  # Good
+    '优': 1.00   # Excellent
+})
+
+# Assessment counts in term order (差, 中, 良, 优) and their expected fuzzy scores
+# under the standard scale (0.25, 0.50, 0.75, 1.00): mixed panels, single
+# experts, and unanimous panels at both extremes of the scale
+_COUNTS = np.array([
+    [0, 1, 2, 0],
+    [1, 0, 1, 1],
+    [0, 1, 1, 1],
+    [1, 2, 1, 0],
+    [5, 0, 0, 0],
+    [0, 0, 0, 5],
+    [0, 0, 1, 0],
+    [0, 0, 5, 0],
+], dtype=np.float64)
+_EXPECTED_SCORES = np.array([
+    (0.50 + 2 * 0.75) / 3,
+    (0.25 + 0.75 + 1.00) / 3,
+    (0.50 + 0.75 + 1.00) / 3,
+    (0.25 + 2 * 0.50 + 0.75) / 4,
+    0.25,
+    1.00,
+    0.75,
+    0.75,
+])
+
+
+@lru_cache(maxsize=1)
+def _load_fixture(path):
+    """Parse a YAML fixture file once; later calls return the same object."""
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@pytest.fixture(scope="module")
+def fuzzy_scale():
+    """Standard fuzzy scale for testing, set up once for the module (read-only, safe to share)."""
+    return _FUZZY_SCALE
+
+
+@pytest.fixture(scope="session")
+def sample_fuzzy_data():
+    """Load sample fuzzy data from fixtures, parsed once per session and shared (do not mutate)."""
+    fixture_path = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'sample_fuzzy_data.yaml')
+    return _load_fixture(os.path.normpath(fixture_path))
 
 
 class TestFCEModule:
     """Test cases for FCE module functionality."""
 
-    @pytest.fixture
-    def fuzzy_scale(self):
-        """Standard fuzzy scale for testing."""
-        return {
-            '差': 0.25,  # Poor
-            '中': 0.50,  # Medium
-            '良': 0.75,  # Good
-            '优': 1.00   # Excellent
-        }
-
-    @pytest.fixture
-    def sample_fuzzy_data(self):
-        """Load sample fuzzy data from fixtures."""
-        fixture_path = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'sample_fuzzy_data.yaml')
-        with open(fixture_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-
-    def test_fuzzy_evaluate_membership_sum(self, fuzzy_scale):
-        """Test fuzzy evaluation with membership degree validation."""
-        expert_assessments = {
-            '差': 0,  # No assessments as 'Poor'
-            '中': 1,  # One assessment as 'Medium'
-            '良': 2,  # Two assessments as 'Good'
-            '优': 0   # No assessments as 'Excellent'
-        }
-
+    @pytest.mark.parametrize("expert_assessments,expected_total", [
+        ({'差': 0, '中': 1, '良': 2, '优': 0}, 3),  # Two "Good", one "Medium"
+        ({'差': 1, '中': 0, '良': 1, '优': 1}, 3),  # Spread across the scale
+        ({'差': 0, '中': 1, '良': 1, '优': 1}, 3),  # Three experts, three different terms
+        ({'差': 1, '中': 2, '良': 1, '优': 0}, 4),  # Mostly "Medium"
+    ])
+    def test_fuzzy_evaluate_basic(self, fuzzy_scale, expert_assessments, expected_total):
+        """Test result structure, expert count, score range and membership sum."""
         result = fuzzy_evaluate(expert_assessments, fuzzy_scale)
 
         # Check basic structure
@@ -53,72 +92,100 @@ class TestFCEModule:
         assert 'total_experts' in result
         assert 'valid' in result
 
-        # Check membership sum validation
-        assert result['valid'] == True
-        membership_vector = result['membership_vector']
-        assert abs(np.sum(membership_vector) - 1.0) < 1e-6
-
-    def test_fuzzy_evaluate_score_range(self, fuzzy_scale):
-        """Test fuzzy evaluation produces scores in correct range."""
-        expert_assessments = {
-            '差': 1,  # One assessment as 'Poor'
-            '中': 0,  # No assessments as 'Medium'
-            '良': 1,  # One assessment as 'Good'
-            '优': 1   # One assessment as 'Excellent'
-        }
-
-        result = fuzzy_evaluate(expert_assessments, fuzzy_scale)
-
-        # Check fuzzy score is in valid range
-        fuzzy_score = result['fuzzy_score']
-        assert 0.0 <= fuzzy_score <= 1.0, f"Fuzzy score {fuzzy_score} not in [0,1] range"
-
-        # Check membership vector is valid
-        membership_vector = result['membership_vector']
-        assert len(membership_vector) == 4  # Should have 4 linguistic terms
-        assert all(0.0 <= mv <= 1.0 for mv in membership_vector), "Membership values should be in [0,1] range"
-
-    def test_fuzzy_evaluate_multiple_experts(self, fuzzy_scale):
-        """Test fuzzy evaluation with multiple experts."""
-        # Aggregate expert assessments into counts
-        # 3 experts: 1 said "良" (Good), 1 said "优" (Excellent), 1 said "中" (Medium)
-        expert_assessments = {
-            '差': 0,  # Count of "Poor" assessments
-            '中': 1,  # Count of "Medium" assessments
-            '良': 1,  # Count of "Good" assessments
-            '优': 1   # Count of "Excellent" assessments
-        }
-
-        result = fuzzy_evaluate(expert_assessments, fuzzy_scale)
-
-        # Should contain fuzzy evaluation results
-        assert 'fuzzy_score' in result
-        assert 'membership_vector' in result
-        assert 'total_experts' in result
-        assert result['total_experts'] == 3
+        assert result['total_experts'] == expected_total
 
         # Fuzzy score should be a reasonable value
         assert 0.0 <= result['fuzzy_score'] <= 1.0
 
-    def test_fuzzy_evaluate_simple(self, fuzzy_scale):
-        """Test fuzzy evaluation with simple expert assessments."""
-        expert_assessments = {
-            '差': 1,  # 1 expert said "Poor"
-            '中': 2,  # 2 experts said "Medium"
-            '良': 1,  # 1 expert said "Good"
-            '优': 0   # 0 experts said "Excellent"
-        }
+        # Check membership sum validation
+        assert result['valid'] == True
+        assert math.isclose(float(result['membership_vector'].sum()), 1.0, abs_tol=1e-6)
+
+    def test_fuzzy_evaluate_table(self, fuzzy_scale):
+        """Test fuzzy scores against the weighted-average table, batched and per row."""
+        result = fuzzy_evaluate_batch(_COUNTS, fuzzy_scale)
+
+        # Weighted average of the scale values, always within [0, 1]
+        np.testing.assert_allclose(result['fuzzy_scores'], _EXPECTED_SCORES, rtol=1e-12)
+        assert np.all((result['fuzzy_scores'] >= 0.0) & (result['fuzzy_scores'] <= 1.0))
+
+        # One membership vector over the 4 linguistic terms per row, each in [0, 1]
+        membership_vectors = result['membership_vectors']
+        assert membership_vectors.shape == (len(_COUNTS), 4)
+        assert np.all((membership_vectors >= 0.0) & (membership_vectors <= 1.0))
+        np.testing.assert_array_equal(result['total_experts'], _COUNTS.sum(axis=1))
+
+        # The batch agrees with the single-assessment implementation
+        terms = ('差', '中', '良', '优')
+        for counts, membership_vector, score in zip(_COUNTS, membership_vectors, result['fuzzy_scores']):
+            single = fuzzy_evaluate(dict(zip(terms, counts)), fuzzy_scale)
+            np.testing.assert_allclose(single['membership_vector'], membership_vector, rtol=1e-12)
+            assert abs(single['fuzzy_score'] - score) < 1e-12
+
+    def test_fuzzy_evaluate_batch_many_indicators(self, fuzzy_scale):
+        """Test batched evaluation of many indicators held in one contiguous counts array."""
+        n_indicators = 1024
+        counts = np.random.default_rng(0).integers(0, 5, size=(n_indicators, 4)).astype(np.float64)
+        counts[:, 1] += 1  # Every indicator has at least one assessment
+
+        result = fuzzy_evaluate_batch(counts, fuzzy_scale)
+
+        assert result['fuzzy_scores'].shape == (n_indicators,)
+        assert result['membership_vectors'].shape == (n_indicators, 4)
+        np.testing.assert_allclose(result['membership_vectors'].sum(axis=1), 1.0, rtol=1e-12)
+
+        # Dict assessments packed with assessments_to_counts give the same scores
+        terms = ('差', '中', '良', '优')
+        assessments = [dict(zip(terms, row)) for row in counts[:16]]
+        packed = assessments_to_counts(assessments)
+        assert packed.shape == (16, 4) and packed.flags['C_CONTIGUOUS']
+        np.testing.assert_array_equal(packed, counts[:16])
+        np.testing.assert_allclose(fuzzy_evaluate_batch(packed, fuzzy_scale)['fuzzy_scores'],
+                                   result['fuzzy_scores'][:16], rtol=1e-12)
+
+    def test_fuzzy_evaluate_batch_compact_dtypes(self, fuzzy_scale):
+        """Test int16 counts evaluated in float32 stay within single precision of float64."""
+        terms = ('差', '中', '良', '优')
+        assessments = [dict(zip(terms, row)) for row in _COUNTS.astype(int)]
+        counts = assessments_to_counts(assessments, dtype=np.int16)
+        assert counts.dtype == np.int16
+
+        result = fuzzy_evaluate_batch(counts, fuzzy_scale, dtype=np.float32)
+
+        assert result['membership_vectors'].dtype == np.float32
+        assert result['fuzzy_scores'].dtype == np.float32
+        np.testing.assert_array_equal(result['total_experts'], _COUNTS.sum(axis=1))
+        assert result['fuzzy_scores'] == pytest.approx(_EXPECTED_SCORES, rel=1e-6)
 
-        result = fuzzy_evaluate(expert_assessments, fuzzy_scale)
+        with pytest.raises(FCEError):
+            fuzzy_evaluate_batch(counts, fuzzy_scale, dtype=np.int16)
+
+    def test_fuzzy_evaluate_memoised_results(self, fuzzy_scale):
+        """Test repeated evaluations never share a result dict or its arrays."""
+        expert_assessments = {'差': 0, '中': 1, '良': 2, '优': 0}
+
+        first = fuzzy_evaluate(expert_assessments, fuzzy_scale)
+        expected_membership = first['membership_vector'].copy()
+        first['num_experts'] = 3  # As aggregate_expert_assessments does
+        first['assessment_distribution']['差'] = 99
+        first['membership_vector'][0] = 99.0
+        second = fuzzy_evaluate(dict(expert_assessments, unknown_term=4), fuzzy_scale)
+
+        assert second['membership_vector'].flags.writeable
+        np.testing.assert_array_equal(second['membership_vector'], expected_membership)
+        assert 'num_experts' not in second
+        assert second['assessment_distribution'] == expert_assessments
+
+    def test_fuzzy_evaluate_batch_invalid_input(self, fuzzy_scale):
+        """Test batched fuzzy evaluation rejects invalid counts."""
+        with pytest.raises(FCEError):
+            fuzzy_evaluate_batch(_COUNTS[0], fuzzy_scale)
 
-        # Should contain fuzzy evaluation results
-        assert 'fuzzy_score' in result
-        assert 'membership_vector' in result
-        assert 'total_experts' in result
-        assert result['total_experts'] == 4
+        with pytest.raises(FCEError):
+            fuzzy_evaluate_batch(-_COUNTS, fuzzy_scale)
 
-        # Fuzzy score should be a reasonable value
-        assert 0.0 <= result['fuzzy_score'] <= 1.0
+        with pytest.raises(FCEError):
+            fuzzy_evaluate_batch(np.zeros((2, 4)), fuzzy_scale)
 
     def test_validate_membership_degrees_valid(self):
         """Test membership degree validation with valid input."""
@@ -134,7 +201,7 @@ class TestFCEModule:
 
             assert validation['all_valid'] == True, f"Indicator {indicator_name} should be valid"
             assert len(validation['error_messages']) == 0, f"Indicator {indicator_name} should have no errors"
-            assert abs(validation['sum_value'] - 1.0) < 1e-6, f"Indicator {indicator_name} sum should be 1.0"
+            assert math.isclose(validation['sum_value'], 1.0, abs_tol=1e-6), f"Indicator {indicator_name} sum should be 1.0"
 
     def test_validate_membership_degrees_invalid(self):
         """Test membership degree validation with invalid input."""
@@ -152,6 +219,13 @@ class TestFCEModule:
             # Check that validation failed through the flags instead
             assert not validation['sum_to_one'], f"Indicator {indicator_name} should fail sum validation"
 
+        # NaN degrees fail the sum check but are not reported as negative
+        validation = validate_membership_degrees(np.array([0.5, np.nan, 0.25, 0.25]))
+        assert validation['all_positive']
+        assert not validation['sum_to_one']
+        assert validation['error_messages'] == []
+        assert isinstance(validation['sum_value'], np.float64)
+
     def test_fuzzy_evaluate_unknown_linguistic_term(self, fuzzy_scale):
         """Test fuzzy evaluation with unknown linguistic term."""
         # Add unknown term to expert assessments
@@ -185,36 +259,6 @@ class TestFCEModule:
         with pytest.raises(FCEError):
             fuzzy_evaluate(expert_assessments, fuzzy_scale)
 
-    def test_fuzzy_evaluate_edge_cases(self, fuzzy_scale):
-        """Test fuzzy evaluation edge cases."""
-        # Test with extreme linguistic terms - all experts say "差" (worst)
-        expert_assessments_worst = {
-            '差': 5,  # All experts say "Poor"
-            '中': 0,
-            '良': 0,
-            '优': 0
-        }
-
-        result_worst = fuzzy_evaluate(expert_assessments_worst, fuzzy_scale)
-
-        # Should handle extreme values correctly
-        assert 'fuzzy_score' in result_worst
-        assert abs(result_worst['fuzzy_score'] - fuzzy_scale['差']) < 1e-6
-
-        # Test with extreme linguistic terms - all experts say "优" (best)
-        expert_assessments_best = {
-            '差': 0,
-            '中': 0,
-            '良': 0,
-            '优': 5   # All experts say "Excellent"
-        }
-
-        result_best = fuzzy_evaluate(expert_assessments_best, fuzzy_scale)
-
-        # Should handle extreme values correctly
-        assert 'fuzzy_score' in result_best
-        assert abs(result_best['fuzzy_score'] - fuzzy_scale['优']) < 1e-6
-
     def test_membership_degree_normalization(self):
         """Test membership degree normalization functionality."""
         # Test with unnormalized vectors
@@ -230,27 +274,6 @@ class TestFCEModule:
             assert validation['all_valid'] == False, f"Vector {i} should be invalid"
             assert not validation['sum_to_one'], f"Vector {i} should not sum to one"
 
-    def test_fuzzy_score_calculation_method(self, fuzzy_scale):
-        """Test fuzzy score calculation method."""
-        expert_assessments = {
-            '差': 0,
-            '中': 1,  # One assessment as 'Medium'
-            '良': 2,  # Two assessments as 'Good'
-            '优': 0   # No assessments as 'Excellent'
-        }
-
-        result = fuzzy_evaluate(expert_assessments, fuzzy_scale)
-
-        # Should use weighted average method
-        fuzzy_score = result['fuzzy_score']
-        membership_vector = result['membership_vector']
-
-        # Manually calculate expected weighted average
-        expected_score = (0 * fuzzy_scale['差'] + 1 * fuzzy_scale['中'] +
-                         2 * fuzzy_scale['良'] + 0 * fuzzy_scale['优']) / 3
-
-        assert abs(fuzzy_score - expected_score) < 1e-6, "Should use weighted average method"
-
     def test_fuzzy_evaluation_data_integrity(self, fuzzy_scale):
         """Test data integrity in fuzzy evaluation results."""
         expert_assessments = {
@@ -294,37 +317,9 @@ class TestFCEModule:
         with pytest.raises(FCEError):
             fuzzy_evaluate({'差': 1, '中': 0, '良': 0, '优': 0}, {})
 
-    def test_confidence_boundary_values(self, fuzzy_scale):
-        """Test confidence values at boundaries."""
-        # Test single expert assessment
-        expert_assessments_single = {
-            '差': 0,
-            '中': 0,
-            '良': 1,  # One assessment as 'Good'
-            '优': 0
-        }
-
-        result_single = fuzzy_evaluate(expert_assessments_single, fuzzy_scale)
-        assert 'fuzzy_score' in result_single
-
-        # Single assessment should give the exact fuzzy scale value
-        assert abs(result_single['fuzzy_score'] - fuzzy_scale['良']) < 1e-6
-
-        # Test with multiple experts - average should be weighted
-        expert_assessments_multiple = {
-            '差': 0,
-            '中': 0,
-            '良': 5,  # Five assessments as 'Good'
-            '优': 0
-        }
-
-        result_multiple = fuzzy_evaluate(expert_assessments_multiple, fuzzy_scale)
-        assert 'fuzzy_score' in result_multiple
-
-        # Multiple same assessments should still give the same fuzzy scale value
-        assert abs(result_multiple['fuzzy_score'] - fuzzy_scale['良']) < 1e-6
-
 
 if __name__ == '__main__':
-    # Run tests if executed directly
-    pytest.main([__file__, '-v'])
\ No newline at end of file
+    # Run tests if executed directly (from the repository root with PYTHONPATH=.,
+    # since the path setup lives in tests/conftest.py); pytest never imports
+    # this module as __main__, so there is no recursive session
+    raise SystemExit(pytest.main([__file__, '-v']))
\ No newline at end of file
@@ -17,10 +17,12 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from modules.ga_optimizer import (
     optimize_configuration,
     fitness_function,
+    fitness_function_batch,
     decode_chromosome,
     validate_constraints,
     plot_convergence,
     calculate_population_diversity,
+    _fitness_batch_size,
     GAError,
     ConstraintError
 )
@@ -130,6 +132,89 @@ class TestGAOptimizerModule:
                 # If there are integration issues, verify function structure
                 assert callable(fitness_function)
 
+    def test_fitness_function_batch_matches_single(self):
+        """Batch fitness equals per-solution fitness; duplicate rows are evaluated once."""
+        config = {
+            'platform_types': ['USV_Unmanned_Surface_Vessel', 'UAV_Unmanned_Aerial_Vehicle'],
+            'num_deployment_zones': 1
+        }
+        solutions = np.array([[5, 4, 25.0, 121.0],
+                              [3, 2, 24.0, 120.0],
+                              [5, 4, 25.0, 121.0]])
+
+        with patch('modules.ga_optimizer.validate_constraints',
+                   return_value={'valid': True, 'warnings': []}), \
+                patch('modules.ga_optimizer.evaluate_single_scheme') as mock_eval:
+            mock_eval.side_effect = lambda cfg, *args: {
+                'ci_score': cfg['platform_inventory']['USV_Unmanned_Surface_Vessel']['count'] / 10
+            }
+            mock_ga = MagicMock()
+            batch = fitness_function_batch(mock_ga, solutions, np.arange(3),
+                                           {}, {}, '', {}, config)
+            assert mock_eval.call_count == 2, "Duplicate chromosomes should be evaluated once"
+
+            single = [fitness_function(mock_ga, s, i, {}, {}, '', {}, config)
+                      for i, s in enumerate(solutions)]
+
+        assert batch.shape == (3,)
+        np.testing.assert_allclose(batch, single)
+
+    def test_fitness_function_batch_cache(self):
+        """Chromosomes scored in an earlier batch are served from the cache."""
+        config = {
+            'platform_types': ['USV_Unmanned_Surface_Vessel', 'UAV_Unmanned_Aerial_Vehicle'],
+            'num_deployment_zones': 1
+        }
+        first = np.array([[5, 4, 25.0, 121.0], [3, 2, 24.0, 120.0]])
+        second = np.array([[3, 2, 24.0, 120.0], [6, 1, 24.0, 120.0]])
+        cache = {}
+
+        with patch('modules.ga_optimizer.validate_constraints',
+                   return_value={'valid': True, 'warnings': []}), \
+                patch('modules.ga_optimizer.evaluate_single_scheme',
+                      return_value={'ci_score': 0.5}) as mock_eval:
+            fitness_function_batch(MagicMock(), first, np.arange(2),
+                                   {}, {}, '', {}, config, cache, 2)
+            fitness = fitness_function_batch(MagicMock(), second, np.arange(2),
+                                             {}, {}, '', {}, config, cache, 2)
+
+        assert mock_eval.call_count == 3, "Cached chromosome should not be re-evaluated"
+        np.testing.assert_allclose(fitness, [0.5, 0.5])
+        assert len(cache) == 2, "Cache should stay within cache_size"
+
+    def test_fitness_batch_size_per_worker(self):
+        """Serial runs score the population in one batch; parallel runs split it per worker."""
+        assert _fitness_batch_size(20, None) == 20
+        assert _fitness_batch_size(20, ['process', 4]) == 5
+        assert _fitness_batch_size(20, ['process', 3]) == 7
+        assert _fitness_batch_size(20, 8) == 3
+        # PyGAD treats a batch size of 1 as unbatched, so batches never shrink below 2
+        assert _fitness_batch_size(4, ['thread', 8]) == 2
+        assert _fitness_batch_size(1, ['thread', 8]) == 1
+
+    @pytest.mark.parametrize('extra_params', [
+        {'parallel_processing': ['thread', 8]},
+        {'fitness_batch_size': 1},
+    ])
+    def test_optimize_configuration_small_batches(self, extra_params):
+        """Optimization completes with more workers than solutions or unbatched fitness."""
+        scenario_config = {
+            'scenario_id': 'test_scenario',
+            'chromosome_encoding': {'genes': [{'name': 'num_usv', 'range': [1, 5]},
+                                              {'name': 'num_uuv', 'range': [0, 3]}]}
+        }
+        ga_params = {'population_size': 4, 'num_generations': 2, 'num_parents_mating': 2,
+                     **extra_params}
+
+        with patch('modules.ga_optimizer.validate_constraints',
+                   return_value={'valid': True, 'warnings': []}), \
+                patch('modules.ga_optimizer.evaluate_single_scheme',
+                      return_value={'ci_score': 0.5}):
+            result = optimize_configuration(scenario_config, ga_params, {}, {}, {}, '')
+
+        assert result['best_fitness'] == pytest.approx(0.5)
+        assert len(result['generation_history']['best_fitness']) == 2
+
     def test_plot_convergence_basic(self):
         """Test basic convergence plotting functionality."""
         ga_results = {
@@ -227,8 +312,8 @@ class TestGAOptimizerModule:
     @pytest.mark.mathematical
     def test_mathematical_properties(self):
         """Test mathematical properties of GA functions."""
-        # Test population diversity with identical population
-        identical_population = np.tile(np.array([1, 2, 3]), (10, 1))
+        # Test population diversity with identical population (a broadcast view, no copies)
+        identical_population = np.broadcast_to(np.array([1, 2, 3]), (10, 3))
         diversity = calculate_population_diversity(identical_population)
 
         # Identical population should have zero diversity
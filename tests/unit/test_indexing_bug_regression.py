@@ -193,18 +193,23 @@ class TestIndexingBugRegression:
             n = np.random.randint(2, 11)  # 2-10 alternatives
             ci_scores = np.random.rand(n)
 
-            # Generate rankings (lower rank = better performance)
-            rankings = len(ci_scores) - np.argsort(ci_scores).argsort()
-
-            # Mathematical invariant: if Ci_i > Ci_j, then rank_i < rank_j
-            for i in range(n):
-                for j in range(n):
-                    if ci_scores[i] > ci_scores[j] + 1e-10:  # Add small epsilon
-                        assert rankings[i] < rankings[j], \
-                            f"Mathematical invariant violated:\n" \
-                            f"Ci[{i}] = {ci_scores[i]:.6f} > Ci[{j}] = {ci_scores[j]:.6f}\n" \
-                            f"but rank[{i}] = {rankings[i]} >= rank[{j}] = {rankings[j]}\n" \
-                            f"This would indicate an indexing or ranking error"
+            # Generate rankings (lower rank = better performance): one stable sort
+            # by descending Ci, then ranks 1..n scattered into place
+            order = np.argsort(-ci_scores, kind='stable')
+            rankings = np.empty(n, dtype=np.intp)
+            rankings[order] = np.arange(1, n + 1)
+
+            # Mathematical invariant: if Ci_i > Ci_j, then rank_i < rank_j,
+            # checked for all (i, j) pairs at once on n x n comparison masks
+            better_ci = ci_scores[:, np.newaxis] > ci_scores[np.newaxis, :] + 1e-10  # Add small epsilon
+            not_better_rank = rankings[:, np.newaxis] >= rankings[np.newaxis, :]
+            violations = np.argwhere(better_ci & not_better_rank)
+            if len(violations):
+                i, j = violations[0]
+                pytest.fail(f"Mathematical invariant violated:\n"
+                            f"Ci[{i}] = {ci_scores[i]:.6f} > Ci[{j}] = {ci_scores[j]:.6f}\n"
+                            f"but rank[{i}] = {rankings[i]} >= rank[{j}] = {rankings[j]}\n"
+                            f"This would indicate an indexing or ranking error")
 
             # Best scheme index validation
             best_rank_idx = np.argmin(rankings)  # Correct: best rank has lowest number
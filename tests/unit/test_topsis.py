@@ -12,7 +12,7 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from modules.topsis_module import topsis_rank, identify_ideal_solutions, TOPSISError
+from modules.topsis_module import topsis_rank, topsis_rank_batch, identify_ideal_solutions, TOPSISError
 from utils.normalization import vector_normalize
 
 
@@ -280,6 +280,38 @@ class TestTOPSISModule:
         np.testing.assert_array_almost_equal(result1['Ci'], result2['Ci'])
         np.testing.assert_array_equal(result1['rankings'], result2['rankings'])
 
+    def test_topsis_rank_batch_matches_single(self, sample_decision_matrix, sample_weights, sample_indicator_types):
+        """Test batched TOPSIS ranks every matrix exactly as topsis_rank does."""
+        rng = np.random.default_rng(7)
+        batch = np.concatenate([sample_decision_matrix[np.newaxis],
+                                rng.uniform(0.0, 10.0, (5,) + sample_decision_matrix.shape),
+                                np.ones((1,) + sample_decision_matrix.shape)])
+
+        result = topsis_rank_batch(batch, sample_weights, sample_indicator_types)
+
+        assert result['Ci'].shape == batch.shape[:2]
+        assert result['rankings'].shape == batch.shape[:2]
+        for b, matrix in enumerate(batch):
+            single = topsis_rank(matrix, sample_weights, sample_indicator_types)
+            np.testing.assert_allclose(result['Ci'][b], single['Ci'], rtol=1e-12)
+            np.testing.assert_array_equal(result['rankings'][b], single['rankings'])
+            np.testing.assert_allclose(result['PIS'][b], single['PIS'], rtol=1e-12)
+            np.testing.assert_allclose(result['NIS'][b], single['NIS'], rtol=1e-12)
+            np.testing.assert_allclose(result['weighted_matrix'][b], single['weighted_matrix'], rtol=1e-12)
+
+    def test_topsis_rank_batch_invalid_input(self, sample_decision_matrix, sample_weights, sample_indicator_types):
+        """Test batched TOPSIS rejects invalid tensors."""
+        with pytest.raises(TOPSISError):
+            topsis_rank_batch(sample_decision_matrix, sample_weights, sample_indicator_types)
+
+        negative_batch = np.stack([sample_decision_matrix, -sample_decision_matrix])
+        with pytest.raises(TOPSISError):
+            topsis_rank_batch(negative_batch, sample_weights, sample_indicator_types)
+
+        bad_types = ['benefit'] * (len(sample_indicator_types) - 1) + ['neutral']
+        with pytest.raises(TOPSISError):
+            topsis_rank_batch(np.stack([sample_decision_matrix] * 2), sample_weights, bad_types)
+
     def test_ideal_solutions_edge_cases(self):
         """Test ideal solution identification with edge cases."""
         # Test with matrix where all values in a column are the same